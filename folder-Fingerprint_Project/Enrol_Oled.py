@@ -1,9 +1,16 @@
 
 # -*- coding: utf-8 -*-
 
+import os
 import time
 import csv
-import json
+try:
+    import orjson as _json          # C serializer, much faster on small dicts
+except ImportError:                 # fall back to stdlib if orjson isn't installed
+    _json = None
+    import json
+from collections import deque
+from functools import lru_cache
 from pathlib import Path
 from fingerprint_sensor import FingerVeinSensor
 from oled import OLED
@@ -27,39 +34,83 @@ ITEMS_PER_PAGE = 2
 
 def load_json(path: Path) -> dict:
     if path.exists():
+        if _json is not None:
+            return _json.loads(path.read_bytes())
         return json.loads(path.read_text())
     return {}
 
 def save_json(path: Path, data: dict) -> None:
-    path.write_text(json.dumps(data, indent=2))
-
-
-def load_users_from_csv(csv_path: Path) -> list[dict]:
+    # Write to a sibling tmp file then os.replace: the rename is atomic, so a
+    # power cut mid-write can never leave a truncated map on disk.
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    if _json is not None:
+        tmp.write_bytes(_json.dumps(data, option=_json.OPT_INDENT_2))
+    else:
+        tmp.write_text(json.dumps(data, indent=2))
+    os.replace(tmp, path)
+
+
+def _clean(field: str) -> str:
+    """Strip a field only when it actually carries stray whitespace."""
+    if field and (field[0].isspace() or field[-1].isspace()):
+        return field.strip()
+    return field
+
+
+def load_users_from_csv(csv_path: Path) -> list[tuple[str, str]]:
+    """Load (code, name) tuples. csv.reader + resolved column indices skips
+    the per-row dict allocation DictReader would pay."""
     if not csv_path.exists():
         raise FileNotFoundError(f"CSV file not found: {csv_path}")
 
     with csv_path.open("r", newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        users = [row for row in reader]
+        reader = csv.reader(f, skipinitialspace=True)
+        header = next(reader, None)
+        if header is None:
+            raise ValueError("CSV file is empty or has no data rows.")
+
+        if USER_KEY_COL not in header:
+            raise ValueError(
+                f"CSV does not contain required column '{USER_KEY_COL}'. "
+                f"Columns found: {header}"
+            )
+        key_idx = header.index(USER_KEY_COL)
+        name_idx = header.index(USER_NAME_COL) if USER_NAME_COL in header else None
+
+        users = [
+            (_clean(row[key_idx]),
+             _clean(row[name_idx]) if name_idx is not None and len(row) > name_idx else "")
+            for row in reader
+            if len(row) > key_idx
+        ]
 
     if not users:
         raise ValueError("CSV file is empty or has no data rows.")
 
-    if USER_KEY_COL not in users[0]:
-        raise ValueError(
-            f"CSV does not contain required column '{USER_KEY_COL}'. "
-            f"Columns found: {list(users[0].keys())}"
-        )
-
     return users
 
 
+def wait_for(keypad: KeypadUART, accept: set) -> tuple:
+    """Block until the keypad yields an event whose name is in `accept`.
+
+    Waits in the kernel via KeypadUART.wait_events instead of the old
+    poll() + time.sleep(0.05) spin, so prompts burn no CPU while idle.
+    """
+    while True:
+        for ev in keypad.wait_events(None):
+            if ev[0] in accept:
+                return ev
+
+
+# The same header/footer/user strings are truncated on every render, so a
+# small cache turns the strip + slice into a dict hit.
+@lru_cache(maxsize=512)
 def _short(s: str, max_len: int) -> str:
     s = (s or "").strip()
     return s if len(s) <= max_len else (s[: max_len - 1] + ".")
 
 
-def choose_user_oled(users: list[dict], oled: OLED, keypad: KeypadUART) -> dict:
+def choose_user_oled(users: list[tuple[str, str]], oled: OLED, keypad: KeypadUART) -> tuple[str, str]:
     """
     OLED paging + keypad selection:
       - PgUp = next page
@@ -75,98 +126,127 @@ def choose_user_oled(users: list[dict], oled: OLED, keypad: KeypadUART) -> dict:
     selected_abs_idx = None
     total_pages = (len(users) + ITEMS_PER_PAGE - 1) // ITEMS_PER_PAGE
 
+    # The user list is static, so truncate every string once up front;
+    # render() then only assembles four precomputed lines per frame.
+    headers = [_short(f"USER {p+1}/{total_pages}", 21) for p in range(total_pages)]
+    footer_nav = _short("PgUp/PgDn 1-2 Sel", 21)
+    footer_sel = _short("ENTER=OK  BACK=CAN", 21)
+    labels_plain = []
+    labels_selected = []
+    for i, (code, name) in enumerate(users):
+        label = f"{i % ITEMS_PER_PAGE + 1}) {code}"
+        if name:
+            label += f" {name}"
+        labels_plain.append(_short(" " + label, 21))
+        labels_selected.append(_short(">" + label, 21))
+
     def render():
-        nonlocal page, selected_abs_idx
         start = page * ITEMS_PER_PAGE
         end = min(start + ITEMS_PER_PAGE, len(users))
-        visible = users[start:end]
-
-        header = f"USER {page+1}/{total_pages}"
-        footer = "PgUp/PgDn 1-2 Sel"
-        if selected_abs_idx is not None:
-            footer = "ENTER=OK  BACK=CAN"
-
-        lines = [_short(header, 21)]
-
-        # user lines (2 lines)
-        for i in range(ITEMS_PER_PAGE):
-            if i < len(visible):
-                u = visible[i]
-                code = (u.get(USER_KEY_COL) or "").strip()
-                name = (u.get(USER_NAME_COL) or "").strip()
-                label = f"{i+1}) {code}"
-                if name:
-                    label += f" {name}"
-                abs_idx = start + i
-                prefix = ">" if (selected_abs_idx == abs_idx) else " "
-                lines.append(_short(prefix + label, 21))
+
+        lines = [headers[page]]
+        for abs_idx in range(start, end):
+            if selected_abs_idx == abs_idx:
+                lines.append(labels_selected[abs_idx])
             else:
-                lines.append("")
+                lines.append(labels_plain[abs_idx])
+        for _ in range(ITEMS_PER_PAGE - (end - start)):
+            lines.append("")
 
-        lines.append(_short(footer, 21))
+        lines.append(footer_sel if selected_abs_idx is not None else footer_nav)
         oled.show_lines(lines)
 
     render()
 
+    dirty = False
+
+    def _on_pgup(value):
+        nonlocal page, selected_abs_idx, dirty
+        page = (page + 1) % total_pages
+        selected_abs_idx = None
+        dirty = True
+
+    def _on_pgdn(value):
+        nonlocal page, selected_abs_idx, dirty
+        page = (page - 1) % total_pages
+        selected_abs_idx = None
+        dirty = True
+
+    def _on_back(value):
+        raise RuntimeError("User selection cancelled.")
+
+    def _on_key(value):
+        # only accept numeric selection keys: 1..ITEMS_PER_PAGE
+        nonlocal selected_abs_idx, dirty
+        if value.isdigit():
+            pick = int(value)
+            start = page * ITEMS_PER_PAGE
+            end = min(start + ITEMS_PER_PAGE, len(users))
+            visible_count = end - start
+
+            if 1 <= pick <= visible_count and pick <= ITEMS_PER_PAGE:
+                selected_abs_idx = start + (pick - 1)
+                dirty = True
+
+    def _on_enter(value):
+        nonlocal dirty
+        if selected_abs_idx is None:
+            oled.show_lines(["NO SELECTION", "PRESS 1-2", "", ""])
+            time.sleep(0.8)
+            dirty = True
+            return None
+        return users[selected_abs_idx]
+
+    # Dict dispatch instead of a five-way == chain per event
+    handlers = {"PgUp": _on_pgup, "PgDn": _on_pgdn, "back": _on_back,
+                "key": _on_key, "enter": _on_enter}
+
     while True:
-        # Poll keypad events
-        events = keypad.poll()
+        # Block in the kernel until keypad bytes arrive; no polling tax
+        events = keypad.wait_events(None)
         if not events:
-            time.sleep(0.05)
             continue
 
+        # Coalesce redraws: mark state dirty per event, flush one frame per batch
+        dirty = False
         for event, value in events:
-            if event == "PgUp":
-                page = (page + 1) % total_pages
-                selected_abs_idx = None
-                render()
-
-            elif event == "PgDn":
-                page = (page - 1) % total_pages
-                selected_abs_idx = None
-                render()
-
-            elif event == "back":
-                raise RuntimeError("User selection cancelled.")
-
-            elif event == "key":
-                # only accept numeric selection keys: 1..ITEMS_PER_PAGE
-                if value.isdigit():
-                    pick = int(value)
-                    start = page * ITEMS_PER_PAGE
-                    end = min(start + ITEMS_PER_PAGE, len(users))
-                    visible_count = end - start
-
-                    if 1 <= pick <= visible_count and pick <= ITEMS_PER_PAGE:
-                        selected_abs_idx = start + (pick - 1)
-                        render()
-
-            elif event == "enter":
-                if selected_abs_idx is None:
-                    oled.show_lines(["NO SELECTION", "PRESS 1-2", "", ""])
-                    time.sleep(0.8)
-                    render()
-                    continue
-                return users[selected_abs_idx]
-
-
-def assign_next_code(user_id: int, mapping: dict) -> str:
+            handler = handlers.get(event)
+            if handler is None:
+                continue
+            chosen = handler(value)     # only _on_enter can return a user
+            if chosen is not None:
+                return chosen
+
+        if dirty:
+            render()
+
+
+def free_codes(mapping: dict) -> deque:
+    """Codes not yet assigned in `mapping`, in AVAILABLE_CODES order.
+
+    Built once per enrollment session so assign_next_code is O(1) per
+    assignment instead of rebuilding set(mapping.values()) each call.
+    """
+    used = set(mapping.values())
+    return deque(code for code in AVAILABLE_CODES if code not in used)
+
+
+def assign_next_code(user_id: int, mapping: dict, free: deque) -> str:
     uid = str(user_id)
     if uid in mapping:
         return mapping[uid]
 
-    used = set(mapping.values())
-    for code in AVAILABLE_CODES:
-        if code not in used:
-            mapping[uid] = code
-            return code
+    if not free:
+        raise RuntimeError("No available codes left. Add more to AVAILABLE_CODES.")
 
-    raise RuntimeError("No available codes left. Add more to AVAILABLE_CODES.")
+    code = free.popleft()
+    mapping[uid] = code
+    return code
 
 
 def enroll_finger_for_selected_user(
     sensor: FingerVeinSensor,
-    selected_user: dict,
+    selected_user: tuple[str, str],
     oled: OLED,
     keypad: KeypadUART,
     start_id=0,
@@ -174,9 +254,9 @@ def enroll_finger_for_selected_user(
 ) -> tuple[int, str]:
     finger_code_map = load_json(MAP_FILE)
     user_finger_map = load_json(USER_FINGER_MAP_FILE)
+    free = free_codes(finger_code_map)
 
-    user_key = selected_user[USER_KEY_COL].strip()
-    user_name = (selected_user.get(USER_NAME_COL) or "").strip()
+    user_key, user_name = selected_user
 
     # if user already linked
     if user_key in user_finger_map:
@@ -188,38 +268,14 @@ def enroll_finger_for_selected_user(
             "ENTER=NEW BACK=KEEP"
         ])
 
-        while True:
-            for ev, val in keypad.poll():
-                if ev == "back":
-                    return int(existing["finger_id"]), existing["code"]
-                if ev == "enter":
-                    break
-            else:
-                time.sleep(0.05)
-                continue
-            break
-
-    # Start enrollment
-    oled.show_lines(["ENROLL NEW", "PRESS ENTER", "BACK=cancel", ""])
-    while True:
-        for ev, val in keypad.poll():
-            if ev == "back":
-                raise RuntimeError("Enrollment cancelled.")
-            if ev == "enter":
-                break
-        else:
-            time.sleep(0.05)
-            continue
-        break
-
-    oled.show_lines(["FIND EMPTY ID", "PLEASE WAIT...", "", ""])
-    finger_id = sensor.get_empty_id(start_id=start_id, end_id=end_id)
+        if wait_for(keypad, {"enter", "back"})[0] == "back":
+            return int(existing["finger_id"]), existing["code"]
 
-    oled.show_lines(["ENROLLING...", f"ID: {finger_id}", "FOLLOW SENSOR", ""])
-    result = sensor.enroll_user(user_id=finger_id, group_id=1, temp_num=3)
-
-    if result == 0:
-        code = assign_next_code(finger_id, finger_code_map)
+    # Result handlers return (finger_id, code) when done, or None to retry.
+    # Retries stay in the loop below and reuse the maps already in memory
+    # instead of recursing and re-parsing both JSON files each attempt.
+    def _on_success(finger_id, result):
+        code = assign_next_code(finger_id, finger_code_map, free)
         save_json(MAP_FILE, finger_code_map)
 
         user_finger_map[user_key] = {"finger_id": finger_id, "code": code, "name": user_name}
@@ -229,33 +285,39 @@ def enroll_finger_for_selected_user(
         time.sleep(2)
         return finger_id, code
 
-    if result == 10:
+    def _on_duplicate(finger_id, result):
         oled.show_lines(["FINGER EXISTS", "TRY ANOTHER", "ENTER=retry", "BACK=stop"])
-        while True:
-            for ev, val in keypad.poll():
-                if ev == "back":
-                    raise RuntimeError("Enrollment cancelled (duplicate finger).")
-                if ev == "enter":
-                    return enroll_finger_for_selected_user(sensor, selected_user, oled, keypad, start_id, end_id)
-            time.sleep(0.05)
+        if wait_for(keypad, {"enter", "back"})[0] == "back":
+            raise RuntimeError("Enrollment cancelled (duplicate finger).")
+        return None
+
+    def _on_error(finger_id, result):
+        raise RuntimeError(f"Enrollment failed with error code: {result}")
+
+    handlers = {0: _on_success, 10: _on_duplicate}
+
+    while True:
+        oled.show_lines(["ENROLL NEW", "PRESS ENTER", "BACK=cancel", ""])
+        if wait_for(keypad, {"enter", "back"})[0] == "back":
+            raise RuntimeError("Enrollment cancelled.")
 
-    raise RuntimeError(f"Enrollment failed with error code: {result}")
+        oled.show_lines(["FIND EMPTY ID", "PLEASE WAIT...", "", ""])
+        finger_id = sensor.get_empty_id(start_id=start_id, end_id=end_id)
+
+        oled.show_lines(["ENROLLING...", f"ID: {finger_id}", "FOLLOW SENSOR", ""])
+        result = sensor.enroll_user(user_id=finger_id, group_id=1, temp_num=3)
+
+        outcome = handlers.get(result, _on_error)(finger_id, result)
+        if outcome is not None:
+            return outcome
 
 
 def ask_and_enroll_flow(sensor: FingerVeinSensor, oled: OLED, keypad: KeypadUART):
     oled.show_lines(["ENROLL FINGER?", "ENTER=yes", "BACK=no", ""])
-    while True:
-        for ev, val in keypad.poll():
-            if ev == "back":
-                oled.show_lines(["SKIPPING...", "", "", ""])
-                time.sleep(0.8)
-                return
-            if ev == "enter":
-                break
-        else:
-            time.sleep(0.05)
-            continue
-        break
+    if wait_for(keypad, {"enter", "back"})[0] == "back":
+        oled.show_lines(["SKIPPING...", "", "", ""])
+        time.sleep(0.8)
+        return
 
     users = load_users_from_csv(USERS_CSV)
     selected_user = choose_user_oled(users, oled, keypad)
@@ -1,5 +1,11 @@
+import os
 import csv
-import json
+try:
+    import orjson as _json          # C serializer, much faster on small dicts
+except ImportError:                 # fall back to stdlib if orjson isn't installed
+    _json = None
+    import json
+from collections import deque
 from pathlib import Path
 from fingerprint_sensor import FingerVeinSensor
 
@@ -18,41 +24,68 @@ AVAILABLE_CODES = [
 
 def load_json(path: Path) -> dict:
     if path.exists():
+        if _json is not None:
+            return _json.loads(path.read_bytes())
         return json.loads(path.read_text())
     return {}
 
 def save_json(path: Path, data: dict) -> None:
-    path.write_text(json.dumps(data, indent=2))
-
-
-def load_users_from_csv(csv_path: Path) -> list[dict]:
+    # Write to a sibling tmp file then os.replace: the rename is atomic, so a
+    # power cut mid-write can never leave a truncated map on disk.
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    if _json is not None:
+        tmp.write_bytes(_json.dumps(data, option=_json.OPT_INDENT_2))
+    else:
+        tmp.write_text(json.dumps(data, indent=2))
+    os.replace(tmp, path)
+
+
+def _clean(field: str) -> str:
+    """Strip a field only when it actually carries stray whitespace."""
+    if field and (field[0].isspace() or field[-1].isspace()):
+        return field.strip()
+    return field
+
+
+def load_users_from_csv(csv_path: Path) -> list[tuple[str, str]]:
+    """Load (code, name) tuples. csv.reader + resolved column indices skips
+    the per-row dict allocation DictReader would pay."""
     if not csv_path.exists():
         raise FileNotFoundError(f"CSV file not found: {csv_path}")
 
     with csv_path.open("r", newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        users = [row for row in reader]
+        reader = csv.reader(f, skipinitialspace=True)
+        header = next(reader, None)
+        if header is None:
+            raise ValueError("CSV file is empty or has no data rows.")
+
+        if USER_KEY_COL not in header:
+            raise ValueError(
+                f"CSV does not contain required column '{USER_KEY_COL}'. "
+                f"Columns found: {header}"
+            )
+        key_idx = header.index(USER_KEY_COL)
+        name_idx = header.index(USER_NAME_COL) if USER_NAME_COL in header else None
+
+        users = [
+            (_clean(row[key_idx]),
+             _clean(row[name_idx]) if name_idx is not None and len(row) > name_idx else "")
+            for row in reader
+            if len(row) > key_idx
+        ]
 
     if not users:
         raise ValueError("CSV file is empty or has no data rows.")
 
-    if USER_KEY_COL not in users[0]:
-        raise ValueError(
-            f"CSV does not contain required column '{USER_KEY_COL}'. "
-            f"Columns found: {list(users[0].keys())}"
-        )
-
     return users
 
 
-def choose_user(users: list[dict]) -> dict:
+def choose_user(users: list[tuple[str, str]]) -> tuple[str, str]:
     """
-    Shows a numbered list and returns the chosen user dict.
+    Shows a numbered list and returns the chosen (code, name) tuple.
     """
     print("\n--- CHOOSE USER FROM CSV ---")
-    for i, u in enumerate(users, start=1):
-        key = u.get(USER_KEY_COL, "").strip()
-        name = u.get(USER_NAME_COL, "").strip()
+    for i, (key, name) in enumerate(users, start=1):
         display = f"{key}" + (f" - {name}" if name else "")
         print(f"{i}. {display}")
 
@@ -68,25 +101,31 @@ def choose_user(users: list[dict]) -> dict:
         print("Invalid selection. Try again.")
 
 
-def assign_next_code(user_id: int, mapping: dict) -> str:
+def free_codes(mapping: dict) -> deque:
+    """Codes not yet assigned in `mapping`, in AVAILABLE_CODES order."""
+    used = set(mapping.values())
+    return deque(code for code in AVAILABLE_CODES if code not in used)
+
+
+def assign_next_code(user_id: int, mapping: dict, free: deque) -> str:
     """
-    Same as your existing function (kept).
+    Assign the next free code to this user_id in O(1).
     mapping: {finger_user_id(str): code(str)}
+    free: deque from free_codes(mapping), shared across retries.
     """
     uid = str(user_id)
     if uid in mapping:
         return mapping[uid]
 
-    used = set(mapping.values())
-    for code in AVAILABLE_CODES:
-        if code not in used:
-            mapping[uid] = code
-            return code
+    if not free:
+        raise RuntimeError("No available codes left. Add more to AVAILABLE_CODES.")
 
-    raise RuntimeError("No available codes left. Add more to AVAILABLE_CODES.")
+    code = free.popleft()
+    mapping[uid] = code
+    return code
 
 
-def enroll_finger_for_selected_user(sensor: FingerVeinSensor, selected_user: dict,
+def enroll_finger_for_selected_user(sensor: FingerVeinSensor, selected_user: tuple[str, str],
                                    start_id=0, end_id=200) -> tuple[int, str]:
     """
     Enroll a finger and link it to the selected user from CSV.
@@ -94,9 +133,9 @@ def enroll_finger_for_selected_user(sensor: FingerVeinSensor, selected_user: dic
     """
     finger_code_map = load_json(MAP_FILE)
     user_finger_map = load_json(USER_FINGER_MAP_FILE)
+    free = free_codes(finger_code_map)
 
-    user_key = selected_user[USER_KEY_COL].strip()
-    user_name = selected_user.get(USER_NAME_COL, "").strip()
+    user_key, user_name = selected_user
 
     # If user already has a finger linked, warn & allow overwrite
     if user_key in user_finger_map:
@@ -124,7 +163,7 @@ def enroll_finger_for_selected_user(sensor: FingerVeinSensor, selected_user: dic
 
         if result == 0:
             # Success -> assign code & save
-            code = assign_next_code(finger_id, finger_code_map)
+            code = assign_next_code(finger_id, finger_code_map, free)
             save_json(MAP_FILE, finger_code_map)
 
             user_finger_map[user_key] = {
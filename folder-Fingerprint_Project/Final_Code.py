@@ -1,18 +1,28 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import os
+import sys
 import time
 import csv
-import json
+try:
+    import orjson as _json          # C serializer, much faster on small dicts
+except ImportError:                 # fall back to stdlib if orjson isn't installed
+    _json = None
+    import json
+import atexit
+import selectors
 import threading
 import queue
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 
 from PIL import Image  # <-- needed for idle frames
-from oled import OLED
+from oled import OLED, pack_frame
 from keypad import KeypadUART
 from fingerprint_sensor import FingerVeinSensor
+from helpers import _frame_sort_key
 
 # =========================
 # Config
@@ -26,7 +36,6 @@ USER_NAME_COL = "Employee Name"
 USER_CODE_COL = "Code"
 
 ATTENDANCE_LOG = Path("attendance_log.csv")
-SENSOR_LOCK = threading.Lock()
 
 # Mapping files
 MAP_FILE = Path("finger_code_map.json")             # finger_id(str) -> user_code(str)
@@ -42,6 +51,25 @@ IDLE_RETRIES = 3       # retry OLED display on occasional I2C glitches
 # =========================
 # Idle Animator (frames -> OLED)
 # =========================
+def _diff_slices(prev: bytes, cur: bytes, width: int = 128) -> list:
+    """
+    Changed regions between two packed frames, as (page, col_start, data)
+    slices for OLED.blit_slices. Looping idle animations change a small
+    fraction of pixels per frame, so this cuts I2C traffic several-fold.
+    """
+    slices = []
+    for page in range(len(cur) // width):
+        a = prev[page * width:(page + 1) * width]
+        b = cur[page * width:(page + 1) * width]
+        if a == b:
+            continue
+        lo = next(i for i in range(width) if a[i] != b[i])
+        hi = next(i for i in range(width - 1, -1, -1) if a[i] != b[i])
+        slices.append((page, lo, b[lo:hi + 1]))
+    return slices
+
+
+
 class IdleAnimator:
     """
     Non-blocking OLED animation from pre-rendered frames (PNG files).
@@ -56,32 +84,75 @@ class IdleAnimator:
       - step controls perceived speed more than fps
       - fps controls how often we try to push a new full frame over I2C
     """
-    def __init__(self, oled: OLED, frames_dir: Path, fps=8, step=1, retries=2, retry_delay=0.03):
+    def __init__(self, oled: OLED, frames_dir: Path, fps=8, step=1, retries=2,
+                 retry_delay=0.03, resync_every=64):
         self.oled = oled
         self.frames_dir = Path(frames_dir)
         self.fps = float(fps)
         self.step = max(1, int(step))
         self.retries = int(retries)
         self.retry_delay = float(retry_delay)
+        self.resync_every = int(resync_every)   # periodic full frame vs I2C glitches
 
         self.enabled = False
         self._frames = []
         self._idx = 0
         self._last_ts = 0.0
+        self._need_full = True
+        self._since_full = 0
 
         self.reload()
 
     def reload(self):
-        self._frames = sorted(self.frames_dir.glob("frame_*.png"))
-        if not self._frames:
+        # Decode + convert every frame once up front; tick() then only
+        # indexes and pushes. Per-frame disk I/O, PNG decode and mode
+        # conversion were the bulk of each tick's cost.
+        paths = sorted(self.frames_dir.glob("frame_*.png"), key=_frame_sort_key)
+        if not paths:
             raise FileNotFoundError(
                 f"No frames found in {self.frames_dir}. Expected frame_001.png etc."
             )
-        self._idx = 0
+        # Image.open is lazy: force the decode here with load(), and fail
+        # fast on a mis-sized frame rather than mid-I2C-transfer later.
+        panel_size = self.oled.device.size
+        self._all_frames = []
+        for fp in paths:
+            img = Image.open(fp).convert("1")
+            img.load()
+            if img.size != panel_size:
+                raise ValueError(
+                    f"{fp.name}: frame size {img.size} does not match panel {panel_size}"
+                )
+            self._all_frames.append(img)
+        # Packed buffers for the raw single-burst I2C path, if available
+        self._all_raw = (
+            [pack_frame(img) for img in self._all_frames] if self.oled.raw_ok else None
+        )
+        self._apply_step()
         self._last_ts = 0.0
 
+    def _apply_step(self):
+        # Frame skipping happens here by slicing the preloaded list, so the
+        # runtime advance is a plain +1 modulo.
+        self._frames = self._all_frames[:: self.step]
+        self._raw = self._all_raw[:: self.step] if self._all_raw is not None else None
+        if self._raw is not None:
+            # Diff each frame against its predecessor in playback order
+            # (frame 0 wraps against the last frame of the loop).
+            self._diffs = [
+                _diff_slices(self._raw[i - 1], self._raw[i])
+                for i in range(len(self._raw))
+            ]
+        else:
+            self._diffs = None
+        self._idx = 0
+        self._need_full = True
+
     def enable(self, reset=True):
         self.enabled = True
+        # Other screens may have overwritten the panel while disabled, so
+        # the next frame must be a full write before diffs resume.
+        self._need_full = True
         if reset:
             self._idx = 0
             self._last_ts = 0.0
@@ -92,36 +163,49 @@ class IdleAnimator:
     def set_fps(self, fps):
         self.fps = float(fps)
 
+    def next_due(self):
+        """Seconds until the next frame is due (0.0 when overdue)."""
+        if not self.enabled or self.fps <= 0:
+            return None
+        return max(0.0, self._last_ts + 1.0 / self.fps - time.monotonic())
+
     def set_step(self, step):
         self.step = max(1, int(step))
+        self._apply_step()
 
-    def _safe_display(self, img: Image.Image) -> bool:
-        img = img.convert("1")
+    def _safe_display(self, idx: int) -> bool:
+        # Frames are already mode "1"; no per-frame conversion here.
         for _ in range(self.retries):
             try:
-                self.oled.device.display(img)
+                if self._raw is not None:
+                    if self._need_full or self._since_full >= self.resync_every:
+                        self.oled.blit_raw(self._raw[idx])   # full-frame resync
+                        self._need_full = False
+                        self._since_full = 0
+                    else:
+                        slices = self._diffs[idx]
+                        if slices:   # empty = identical frame, nothing to send
+                            self.oled.blit_slices(slices)
+                        self._since_full += 1
+                else:
+                    self.oled.device.display(self._frames[idx])
                 return True
             except OSError:
+                self._need_full = True   # panel state unknown after a glitch
                 time.sleep(self.retry_delay)
         return False
 
     def tick(self) -> bool:
+        # Cadence is enforced by the run loop via next_due(), so a call here
+        # always means a frame is due -- no per-call interval early-out.
         if not self.enabled:
             return False
 
-        now = time.time()
-        interval = 1.0 / self.fps if self.fps > 0 else 0.0
-        if (now - self._last_ts) < interval:
-            return False
-
-        fp = self._frames[self._idx]
-        img = Image.open(fp)
-
-        ok = self._safe_display(img)
-        self._last_ts = now
+        ok = self._safe_display(self._idx)
+        self._last_ts = time.monotonic()
 
-        # Advance by step (this controls speed a lot)
-        self._idx = (self._idx + self.step) % len(self._frames)
+        # Step was applied when the list was sliced at load time
+        self._idx = (self._idx + 1) % len(self._frames)
         return ok
 
 
@@ -130,16 +214,24 @@ class IdleAnimator:
 # =========================
 def load_json(path: Path) -> dict:
     if path.exists():
+        if _json is not None:
+            return _json.loads(path.read_bytes())
         return json.loads(path.read_text())
     return {}
 
 def save_json(path: Path, data: dict) -> None:
-    path.write_text(json.dumps(data, indent=2))
+    # Atomic tmp + os.replace, same as the enrollment scripts
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    if _json is not None:
+        tmp.write_bytes(_json.dumps(data, option=_json.OPT_INDENT_2))
+    else:
+        tmp.write_text(json.dumps(data, indent=2))
+    os.replace(tmp, path)
 
 def load_users_from_csv(csv_path: Path) -> list[dict]:
     if not csv_path.exists():
         raise FileNotFoundError(f"User list CSV not found: {csv_path}")
-    with csv_path.open("r", newline="", encoding="utf-8") as f:
+    with csv_path.open("r", newline="", encoding="utf-8", buffering=1 << 20) as f:
         reader = csv.DictReader(f)
         users = [row for row in reader]
     if not users:
@@ -147,71 +239,124 @@ def load_users_from_csv(csv_path: Path) -> list[dict]:
     return users
 
 def load_code_to_name(csv_path: Path) -> dict:
-    users = load_users_from_csv(csv_path)
+    if not csv_path.exists():
+        raise FileNotFoundError(f"User list CSV not found: {csv_path}")
     out = {}
-    for row in users:
-        code = (row.get(USER_CODE_COL) or "").strip()
-        name = (row.get(USER_NAME_COL) or "").strip()
-        if code:
-            out[code] = name or "UNKNOWN"
+    # Single streaming pass with a wide read buffer: no intermediate row
+    # list, no per-row dicts -- column indices are resolved from the header.
+    with csv_path.open("r", newline="", encoding="utf-8", buffering=1 << 20) as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            raise ValueError("CSV is empty.")
+        code_idx = header.index(USER_CODE_COL)
+        name_idx = header.index(USER_NAME_COL)
+        for row in reader:
+            if len(row) <= max(code_idx, name_idx):
+                continue
+            code = row[code_idx].strip()
+            if code.isdigit():
+                # int keys skip string hashing on every submit; interned
+                # names are shared across reloads instead of reallocated
+                out[int(code)] = sys.intern(row[name_idx].strip() or "UNKNOWN")
+    if not out:
+        raise ValueError("CSV is empty.")
     return out
 
-def log_attendance(employee_name: str, code: str, method: str, result: str) -> None:
+# strftime is slow enough to matter on the OLED-facing path, and events
+# land within the same second all the time -- cache the formatted pair.
+_ts_cache = (None, "", "")
+
+def _now_strings(now: datetime = None) -> tuple:
+    """(date_str, time_str) for `now`, re-formatted at most once per second."""
+    global _ts_cache
+    if now is None:
+        now = datetime.now()
+    key = (now.year, now.month, now.day, now.hour, now.minute, now.second)
+    if key != _ts_cache[0]:
+        _ts_cache = (key, now.strftime("%Y-%m-%d"), now.strftime("%H:%M:%S"))
+    return _ts_cache[1], _ts_cache[2]
+
+# Attendance rows are queued and written by a daemon thread that keeps the
+# file open, so the OLED-facing path never waits on open/write/close.
+_LOG_Q = queue.SimpleQueue()
+_log_thread = None
+
+def _log_worker():
     ATTENDANCE_LOG.parent.mkdir(parents=True, exist_ok=True)
     new_file = not ATTENDANCE_LOG.exists()
-    now = datetime.now()
-    with ATTENDANCE_LOG.open("a", newline="", encoding="utf-8") as f:
+    with ATTENDANCE_LOG.open("a", newline="", encoding="utf-8", buffering=1 << 16) as f:
         w = csv.writer(f)
         if new_file:
             w.writerow(["date", "time", "employee_name", "code", "method", "result"])
-        w.writerow([now.strftime("%Y-%m-%d"), now.strftime("%H:%M:%S"),
-                    employee_name, code, method, result])
+            f.flush()
+        while True:
+            row = _LOG_Q.get()
+            if row is None:                 # shutdown sentinel from atexit
+                f.flush()
+                return
+            now, employee_name, code, method, result = row
+            date_s, time_s = _now_strings(now)   # formatted off the hot path
+            w.writerow([date_s, time_s, employee_name, code, method, result])
+            if _LOG_Q.empty():
+                f.flush()
+
+def _drain_log_queue():
+    _LOG_Q.put(None)
+    if _log_thread is not None:
+        _log_thread.join(timeout=2)
 
+def log_attendance(employee_name: str, code: str, method: str, result: str) -> None:
+    """Queue one attendance row; the writer thread owns the CSV."""
+    global _log_thread
+    if _log_thread is None:
+        _log_thread = threading.Thread(target=_log_worker, daemon=True)
+        _log_thread.start()
+        atexit.register(_drain_log_queue)
+    _LOG_Q.put((datetime.now(), employee_name, code, method, result))
+
+# Names repeat across check-ins, so cache the truncation results
+@lru_cache(maxsize=1024)
 def _short(s: str, max_len: int = 21) -> str:
-    s = (s or "").strip()
-    return s if len(s) <= max_len else (s[: max_len - 1] + ".")
-
-def finger_lookup(finger_id: int) -> tuple:
-    """Check if finger ID is mapped to a user code."""
-    finger_code_map = load_json(MAP_FILE)  # finger_id -> user_code
-    code = finger_code_map.get(str(finger_id))
-    if not code:
-        return (False, None, None)
-    name = load_code_to_name(USERS_CSV).get(code, "UNKNOWN")
-    return (True, code, name)
-
+    if not s:
+        return ""
+    # Fast path: almost every input already fits and is clean, so skip the
+    # strip/slice allocations entirely unless the edges carry whitespace.
+    if len(s) <= max_len and not s[0].isspace() and not s[-1].isspace():
+        return s
+    t = s.strip()
+    return t if len(t) <= max_len else (t[: max_len - 1] + ".")
 
 # =========================
 # Finger scan background thread
 # =========================
 
 class FingerWorker(threading.Thread):
-    def __init__(self, sensor: FingerVeinSensor, out_q: queue.Queue, lock: threading.Lock):
+    def __init__(self, sensor: FingerVeinSensor, out_q: queue.Queue, wake_fd=None):
         super().__init__(daemon=True)
         self.sensor = sensor
         self.out_q = out_q
-        self.lock = lock
+        self.wake_fd = wake_fd      # pipe write end; one byte per queued event
         self._stop = threading.Event()
 
     def stop(self):
         self._stop.set()
 
     def run(self):
+        # Sole owner of the sensor serial port while the app runs;
+        # verify_and_get_id's own serial timeout paces the polling.
         while not self._stop.is_set():
-            got = self.lock.acquire(timeout=0.2)
-            if not got:
-                continue
             try:
                 fid = self.sensor.verify_and_get_id(user_id=0)  # may block
                 if fid >= 0:  # Only process valid finger IDs
-                    self.out_q.put(("finger_ok", fid))
+                    try:
+                        self.out_q.put_nowait(("finger_ok", fid))
+                    except queue.Full:
+                        continue    # consumer is behind; drop this scan
+                    if self.wake_fd is not None:
+                        os.write(self.wake_fd, b"\x01")  # make the event select()-able
             except Exception:
                 time.sleep(0.2)
-            finally:
-                try:
-                    self.lock.release()
-                except RuntimeError:
-                    pass
 
 
 # =========================
@@ -220,6 +365,7 @@ class FingerWorker(threading.Thread):
 class App:
     def __init__(self):
         self.oled = OLED()
+        self.oled.start_renderer()      # show_lines posts a frame and returns
         self.keypad = KeypadUART(KEYPAD_PORT, KEYPAD_BAUD)
 
         # Idle animator
@@ -247,12 +393,34 @@ class App:
 
         self.code_to_name = load_code_to_name(USERS_CSV)
 
+        # Mapping cached once; re-reading + re-parsing the JSON on every
+        # finger scan was pure overhead on the lookup path.
+        self.finger_code_map = self._load_finger_map()  # finger_id(int) -> code(int)
+        self._map_mtime = MAP_FILE.stat().st_mtime if MAP_FILE.exists() else None
+
         self.state = "IDLE"
         self.buf = ""
-        self.last_ts = time.time()
-
-        self.fq = queue.Queue()
-        self.fw = FingerWorker(self.sensor, self.fq, SENSOR_LOCK)
+        self.last_ts = time.monotonic()
+        self.result_expires_at = 0.0    # deadline for SHOW_RESULT screens
+
+        # Dict dispatch for keypad events (cheaper than an == chain)
+        self._key_handlers = {"key": self._on_key, "back": self._on_back,
+                              "enter": self._on_enter}
+
+        # Finger events come through the queue as before, but the worker
+        # also writes one byte to this pipe so the main loop can block in
+        # select() on keypad + finger together instead of polling the queue.
+        self._finger_r, self._finger_w = os.pipe()
+        os.set_blocking(self._finger_r, False)
+
+        self._sel = selectors.DefaultSelector()
+        self._sel.register(self.keypad.ser, selectors.EVENT_READ, "keypad")
+        self._sel.register(self._finger_r, selectors.EVENT_READ, "finger")
+
+        # Bounded: if the main loop falls behind, the worker drops scans
+        # instead of growing a stale backlog.
+        self.fq = queue.Queue(maxsize=4)
+        self.fw = FingerWorker(self.sensor, self.fq, wake_fd=self._finger_w)
         self.fw.start()
 
         self.enter_idle()
@@ -289,6 +457,13 @@ class App:
             except Exception as e:
                 print(f"Error during sensor shutdown: {e}")
         
+        # Close the finger wakeup pipe
+        try:
+            os.close(self._finger_w)
+            os.close(self._finger_r)
+        except OSError:
+            pass
+
         # Clear OLED
         try:
             self.oled.clear()
@@ -299,12 +474,45 @@ class App:
         print("System shutdown complete")
 
     # ----- Idle control -----
+    def _show_result(self, duration):
+        """Hold the current screen without blocking the loop.
+
+        run() drops back to idle once the deadline passes; keypad and
+        finger input keep being drained in the meantime instead of
+        piling up behind a sleep.
+        """
+        self.state = "SHOW_RESULT"
+        self.result_expires_at = time.monotonic() + duration
+
     def enter_idle(self):
         self.state = "IDLE"
         self.buf = ""
+        self._maybe_reload_maps()      # pick up enrollment-script edits off the hot path
         self.idle.enable(reset=False)  # keep animation position
         # Do NOT call show_lines here; the animator owns the OLED during idle
 
+    @staticmethod
+    def _load_finger_map() -> dict:
+        """finger_code_map.json with keys and codes resolved to int once."""
+        return {int(fid): int(code) for fid, code in load_json(MAP_FILE).items()}
+
+    def _maybe_reload_maps(self):
+        """Re-read finger_code_map.json only when the file changed (cheap stat)."""
+        try:
+            mtime = MAP_FILE.stat().st_mtime
+        except FileNotFoundError:
+            return
+        if mtime != self._map_mtime:
+            self.finger_code_map = self._load_finger_map()
+            self._map_mtime = mtime
+
+    def finger_lookup(self, finger_id: int) -> tuple:
+        """Check if finger ID is mapped to a user code, using cached maps."""
+        code = self.finger_code_map.get(finger_id)
+        if not code:
+            return (False, None, None)
+        return (True, code, self.code_to_name.get(code, "UNKNOWN"))
+
     def exit_idle(self):
         self.idle.disable()
 
@@ -315,93 +523,131 @@ class App:
 
     def handle_finger(self, finger_id: int):
         self.exit_idle()
-        enrolled, code, name = finger_lookup(finger_id)
-        t_now = datetime.now().strftime("%H:%M:%S")
+        enrolled, code, name = self.finger_lookup(finger_id)
+        t_now = _now_strings()[1]
 
         if enrolled:
+            code = str(code)    # int in the cache, string for log + display
             log_attendance(name, code, "finger", "success")
-            self.oled.show_lines([f"Hi {_short(name)}", "Code:", _short(code), t_now])
-            time.sleep(3)
-            self.enter_idle()
+            # Sync: the frame must be up before the 3 s hold starts
+            self.oled.show_lines_sync([f"Hi {_short(name)}", "Code:", _short(code), t_now])
+            self._show_result(3.0)
             return
 
         # Not enrolled -> just show message and return to idle
-        self.oled.show_lines(["UNKNOWN FINGER", "NOT ENROLLED", "", ""])
-        time.sleep(1.5)
-        self.enter_idle()
+        self.oled.show_lines_sync(["UNKNOWN FINGER", "NOT ENROLLED", "", ""])
+        self._show_result(1.5)
 
     def handle_code_submit(self):
         self.exit_idle()
         code = self.buf
-        name = self.code_to_name.get(code)
-        t_now = datetime.now().strftime("%H:%M:%S")
+        name = self.code_to_name.get(int(code))  # buf is all digits by construction
+        t_now = _now_strings()[1]
 
         if name:
             log_attendance(name, code, "code", "success")
-            self.oled.show_lines([f"Hi {_short(name)}", "You arrived:", t_now, ""])
-            time.sleep(3)
+            self.oled.show_lines_sync([f"Hi {_short(name)}", "You arrived:", t_now, ""])
+            self._show_result(3.0)
         else:
             log_attendance("UNKNOWN", code, "code", "fail")
-            self.oled.show_lines(["DENIED", "Invalid code", "", ""])
-            time.sleep(1.5)
+            self.oled.show_lines_sync(["DENIED", "Invalid code", "", ""])
+            self._show_result(1.5)
+
+    # ----- Keypad event handlers (dict-dispatched) -----
+    def _on_key(self, val):
+        # Normal digit entry to start typing code
+        if self.state == "IDLE":
+            self.exit_idle()
+            self.state = "ENTERING"
+            self.buf = ""
+
+        # Only accept digits into the code buffer
+        if self.state == "ENTERING" and val and str(val).isdigit() and len(self.buf) < 5:
+            self.buf += str(val)
+            self.last_ts = time.monotonic()
+            self.show_buf()
+
+    def _on_back(self, val):
+        if self.state == "ENTERING" and self.buf:
+            self.buf = self.buf[:-1]
+            self.last_ts = time.monotonic()
+            self.show_buf()
+        elif self.state == "ENTERING" and not self.buf:
+            self.enter_idle()
 
-        self.enter_idle()
+    def _on_enter(self, val):
+        if self.state == "ENTERING":
+            if len(self.buf) != 5:
+                self.exit_idle()
+                self.oled.show_lines_sync(["INVALID", "Need 5 digits", "", ""])
+                self._show_result(1.0)
+            else:
+                self.handle_code_submit()
+
+    def _handle_keypad_event(self, ev, val):
+        handler = self._key_handlers.get(ev)
+        if handler is not None:
+            handler(val)
 
     def run(self):
         while True:
-            # ---- IDLE animation tick ----
-            if self.state == "IDLE":
-                self.idle.tick()
-
-            # ---- Keypad events ----
-            for ev, val in self.keypad.poll():
-                # Normal digit entry to start typing code
-                if ev == "key":
-                    if self.state == "IDLE":
-                        self.exit_idle()
-                        self.state = "ENTERING"
-                        self.buf = ""
-            
-                    # Only accept digits into the code buffer
-                    if self.state == "ENTERING" and val and str(val).isdigit() and len(self.buf) < 5:
-                        self.buf += str(val)
-                        self.last_ts = time.time()
-                        self.show_buf()
-            
-                elif ev == "back":
-                    if self.state == "ENTERING" and self.buf:
-                        self.buf = self.buf[:-1]
-                        self.last_ts = time.time()
-                        self.show_buf()
-                    elif self.state == "ENTERING" and not self.buf:
-                        self.enter_idle()
-            
-                elif ev == "enter":
-                    if self.state == "ENTERING":
-                        if len(self.buf) != 5:
-                            self.exit_idle()
-                            self.oled.show_lines(["INVALID", "Need 5 digits", "", ""])
-                            time.sleep(1.0)
-                            self.enter_idle()
-                        else:
-                            self.handle_code_submit()
-
-            # ---- typing timeout ----
-            if self.state == "ENTERING" and (time.time() - self.last_ts) > 10:
+            # ---- Result screen expiry (non-blocking hold) ----
+            if self.state == "SHOW_RESULT" and time.monotonic() >= self.result_expires_at:
                 self.enter_idle()
 
-            # ---- Finger events ----
-            try:
-                while True:
-                    fev, fid = self.fq.get_nowait()
-                    if fev == "finger_ok":
+            # ---- IDLE animation tick (only when a frame is due) ----
+            if self.state == "IDLE":
+                due = self.idle.next_due()
+                if due is not None and due <= 0.0:
+                    self.idle.tick()
+
+            # ---- Drain inputs, interleaved ----
+            # One keypad batch, then at most one finger event, repeated
+            # until both sources are quiet -- a burst on one source can't
+            # starve the other.
+            did_work = True
+            while did_work:
+                did_work = False
+                for ev, val in self.keypad.poll():
+                    self._handle_keypad_event(ev, val)
+                    did_work = True
+
+                # Latest-wins drain: a backlog of scans of the same
+                # finger collapses to one handled event instead of
+                # stacking multi-second result screens back-to-back.
+                latest = None
+                try:
+                    while True:
+                        latest = self.fq.get_nowait()
+                except queue.Empty:
+                    pass
+                if latest is not None:
+                    fev, fid = latest
+                    if fev == "finger_ok" and self.state != "SHOW_RESULT":
                         self.state = "IDLE"
                         self.buf = ""
                         self.handle_finger(int(fid))
-            except queue.Empty:
-                pass
+                    did_work = True
 
-            time.sleep(0.02)
+            # ---- typing timeout ----
+            if self.state == "ENTERING" and (time.monotonic() - self.last_ts) > 10:
+                self.enter_idle()
+
+            # Sleep in select until a keypad byte, a finger event, or the
+            # next deadline (idle frame / typing timeout); the drain above
+            # picks the input up on the next pass.
+            if self.state == "IDLE":
+                timeout = self.idle.next_due()
+            elif self.state == "SHOW_RESULT":
+                timeout = max(0.0, self.result_expires_at - time.monotonic())
+            else:
+                timeout = max(0.0, 10 - (time.monotonic() - self.last_ts))
+            for key, _ in self._sel.select(timeout):
+                if key.data == "finger":
+                    try:
+                        os.read(self._finger_r, 64)   # drain wakeup bytes
+                    except BlockingIOError:
+                        pass
 
 
 def main():
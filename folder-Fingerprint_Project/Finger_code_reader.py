@@ -1,7 +1,12 @@
 import csv
-import json
+try:
+    import orjson as _json          # C parser; used for the finger map
+except ImportError:
+    _json = None
+    import json
 from pathlib import Path
 from fingerprint_sensor import FingerVeinSensor
+import finger_registry
 
 
 class FingerCodeReader:
@@ -50,33 +55,53 @@ class FingerCodeReader:
         if not self.users_csv.exists():
             raise FileNotFoundError(f"CSV not found: {self.users_csv}")
 
+        # Stream rows straight into the index: one pass, no intermediate
+        # list holding every row alongside the dict being built.
+        index = {}
         with self.users_csv.open("r", newline="", encoding="utf-8") as f:
             reader = csv.DictReader(f)
-            rows = list(reader)
-
-        if not rows:
+            if reader.fieldnames is None or self.user_key_col not in reader.fieldnames:
+                raise ValueError(
+                    f"CSV missing required column '{self.user_key_col}'. "
+                    f"Found: {list(reader.fieldnames or [])}"
+                )
+            for r in reader:
+                code = (r.get(self.user_key_col) or "").strip()
+                if code:
+                    index[code] = r
+
+        if not index:
             raise ValueError("CSV is empty or has no rows.")
-
-        if self.user_key_col not in rows[0]:
-            raise ValueError(
-                f"CSV missing required column '{self.user_key_col}'. "
-                f"Found: {list(rows[0].keys())}"
-            )
-
-        index = {}
-        for r in rows:
-            code = (r.get(self.user_key_col) or "").strip()
-            if code:
-                index[code] = r
         return index
 
     def _load_finger_map(self) -> dict:
         """
         Load user_finger_map.json.
         """
-        if self.finger_map_path.exists():
-            return json.loads(self.finger_map_path.read_text())
-        return {}
+        # The shared registry caches the default map for every consumer;
+        # only a non-default path pays its own read.
+        if self.finger_map_path == finger_registry.USER_FINGER_MAP_FILE:
+            return finger_registry.get_user_finger_map()
+        # Open directly and catch: one syscall instead of stat + open,
+        # and no exists()/open race window.
+        try:
+            raw = self.finger_map_path.read_bytes()
+        except FileNotFoundError:
+            return {}
+        return _json.loads(raw) if _json is not None else json.loads(raw)
+
+    @staticmethod
+    def _index_by_finger_id(finger_map: dict) -> dict:
+        """
+        Reverse index: finger_id -> CSV code key. Built once per scan
+        session so each verification is a dict get instead of a scan
+        over every enrolled entry.
+        """
+        return {
+            info["finger_id"]: str(code_key).strip()
+            for code_key, info in finger_map.items()
+            if "finger_id" in info
+        }
 
     @staticmethod
     def _is_no_match_error(exc: Exception) -> bool:
@@ -103,6 +128,7 @@ class FingerCodeReader:
         finger_map = self._load_finger_map()
         if not finger_map:
             raise RuntimeError(f"No enrolled fingers found in {self.finger_map_path}")
+        by_finger_id = self._index_by_finger_id(finger_map)
 
         sensor = FingerVeinSensor(baud_index=self.baud_index)
 
@@ -122,11 +148,7 @@ class FingerCodeReader:
                     raise
 
                 # Find which CSV "Code" is linked to this finger_id (JSON keys are the CSV codes)
-                matched_code_key = None
-                for code_key, info in finger_map.items():
-                    if info.get("finger_id") == finger_id:
-                        matched_code_key = str(code_key).strip()
-                        break
+                matched_code_key = by_finger_id.get(finger_id)
 
                 if matched_code_key is None:
                     print("? Finger recognized but not linked to any user. Scan again.")
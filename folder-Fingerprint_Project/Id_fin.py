@@ -1,8 +1,7 @@
-import json
-from pathlib import Path
 from fingerprint_sensor import FingerVeinSensor
+import finger_registry
 
-USER_FINGER_MAP_FILE = Path("user_finger_map.json")
+USER_FINGER_MAP_FILE = finger_registry.USER_FINGER_MAP_FILE
 
 # These match your earlier error: status=1 (FAIL), reason=12 (0x0C VERIFY failed)
 NO_MATCH_STATUS = 1
@@ -10,20 +9,11 @@ NO_MATCH_REASON = 12
 
 
 def load_user_finger_map() -> dict:
-    if USER_FINGER_MAP_FILE.exists():
-        return json.loads(USER_FINGER_MAP_FILE.read_text())
-    return {}
+    return finger_registry.get_user_finger_map()
 
 
-def find_person_by_finger_id(finger_id: int, user_finger_map: dict) -> dict | None:
-    for user_key, info in user_finger_map.items():
-        if info.get("finger_id") == finger_id:
-            return {
-                "user_key": user_key,
-                "name": info.get("name"),
-                "code": info.get("code")
-            }
-    return None
+def find_person_by_finger_id(finger_id: int, by_finger_id: dict) -> dict | None:
+    return by_finger_id.get(finger_id)
 
 
 def is_no_match_error(exc: Exception) -> bool:
@@ -40,6 +30,7 @@ def main():
     if not user_finger_map:
         print("? No enrolled users found in user_finger_map.json.")
         return
+    by_finger_id = finger_registry.get_by_finger_id()
 
     sensor = FingerVeinSensor(baud_index=3)
 
@@ -65,7 +56,7 @@ def main():
                 finger_id = sensor.verify_and_get_id(user_id=0)
 
                 # Lookup person
-                person = find_person_by_finger_id(finger_id, user_finger_map)
+                person = find_person_by_finger_id(finger_id, by_finger_id)
 
                 if person:
                     print("\n? PERSON IDENTIFIED")
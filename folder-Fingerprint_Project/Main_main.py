@@ -2,18 +2,29 @@
 # -*- coding: utf-8 -*-
 
 import os
+import csv
 import time
-import json
+import atexit
+import logging
+from logging.handlers import QueueHandler, QueueListener
+try:
+    import orjson as _json          # C serializer, much faster on small dicts
+except ImportError:                 # requests serializes the payload itself
+    _json = None
 import threading
 import queue
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 import requests
 
 from PIL import Image
+from helpers import load_json, save_json, _short, _hhmm, _pin_to_core, _DIGITS, _frame_sort_key
 from oled import OLED
 from keypad import KeypadUART
 from fingerprint_sensor import FingerVeinSensor
+from checkin_store import CheckinStore
+import finger_registry
 
 # =========================
 # Config
@@ -27,12 +38,26 @@ USER_NAME_COL = "Employee Name"
 USER_CODE_COL = "Code"
 
 CURRENT_STATUS = Path("current_status.json")  # Track who's IN/OUT
-SENSOR_LOCK = threading.Lock()
 
 # Notion Integration
 NOTION_KEY = "ntn_v79048340066HxNnLJZyxkEvbZ993r0IwEHqYB8F3lg4aE"
 NOTION_DATABASE_ID = "2fe1d72a31d680ba9408faba0e8c1d9f"
 
+# Last-known-good marker for the boot-time Notion probe; a fresh marker
+# lets restarts skip the network round-trip entirely.
+NOTION_CHECK_CACHE = Path("notion_check.json")
+NOTION_CHECK_TTL = 3600  # seconds
+
+# Diagnostics go through a queue to a background listener: callers only
+# enqueue a record instead of blocking on a stdout flush per message.
+_log_q = queue.Queue(-1)
+logging.basicConfig(level=logging.INFO, format="%(message)s",
+                    handlers=[QueueHandler(_log_q)])
+_log_listener = QueueListener(_log_q, logging.StreamHandler())
+_log_listener.start()
+atexit.register(_log_listener.stop)
+log = logging.getLogger(__name__)
+
 # Mapping files
 MAP_FILE = Path("finger_code_map.json")
 USER_FINGER_MAP_FILE = Path("user_finger_map.json")
@@ -53,6 +78,19 @@ NOTION_HEADERS = {
     "Notion-Version": "2022-06-28",
 }
 
+# Pooled session with keep-alive: reuses the TLS connection to
+# api.notion.com instead of paying a fresh handshake per check-in.
+NOTION_SESSION = requests.Session()
+NOTION_SESSION.headers.update(NOTION_HEADERS)
+NOTION_SESSION.mount("https://", requests.adapters.HTTPAdapter(
+    pool_connections=2, pool_maxsize=4,
+    max_retries=requests.adapters.Retry(total=2, backoff_factor=0.3),
+))
+
+# Static pieces of the page-create request, built once
+_NOTION_PAGES_URL = "https://api.notion.com/v1/pages"
+_NOTION_PARENT = {"database_id": NOTION_DATABASE_ID}
+
 # =========================
 # ULTRA SIMPLIFIED Notion Function
 # =========================
@@ -63,41 +101,39 @@ def write_to_notion_reason_only(code: str, action: str):
     Format in Reason column: "code(in)" or "code(out)"
     """
     if not NOTION_KEY or not NOTION_DATABASE_ID:
-        print("Notion credentials not configured. Skipping Notion update.")
+        log.info("Notion credentials not configured. Skipping Notion update.")
         return False
-    
+
     try:
         # Create reason text with code followed by (in) or (out)
         reason_text = f"{code}({action.lower()})"  # e.g., "00000(in)" or "00000(out)"
-        
-        # ONLY write to Reason column (title type)
-        # No Date, no Clock In, no Clock Out, no other properties
-        data = {
-            "Reason": {  # Title field (your Reason column is title type)
-                "title": [{"text": {"content": reason_text}}]
-            }
-            # NO other properties - JUST Reason
-        }
-        
-        # Create new page
-        url = "https://api.notion.com/v1/pages"
+
+        # ONLY write to Reason column (title type); the static scaffolding
+        # lives in module constants, only the content string is per-event.
         payload = {
-            "parent": {"database_id": NOTION_DATABASE_ID},
-            "properties": data
+            "parent": _NOTION_PARENT,
+            "properties": {
+                "Reason": {"title": [{"text": {"content": reason_text}}]}
+            },
         }
-        
-        response = requests.post(url, headers=NOTION_HEADERS, json=payload, timeout=5)
+
+        if _json is not None:
+            # Serialize once with orjson; the session headers already
+            # carry content-type, so skip the json= re-encoding path.
+            response = NOTION_SESSION.post(_NOTION_PAGES_URL,
+                                           data=_json.dumps(payload), timeout=5)
+        else:
+            response = NOTION_SESSION.post(_NOTION_PAGES_URL, json=payload, timeout=5)
         
         if response.status_code == 200:
-            now = datetime.now()
-            print(f"Notion: {code} {action} at {now.strftime('%H:%M')} - Reason: {reason_text}")
+            log.info(f"Notion: {code} {action} at {_hhmm()} - Reason: {reason_text}")
             return True
         else:
-            print(f"Notion update failed: {response.status_code} - {response.text}")
+            log.info(f"Notion update failed: {response.status_code} - {response.text}")
             return False
             
     except Exception as e:
-        print(f"Error updating Notion: {e}")
+        log.info(f"Error updating Notion: {e}")
         return False
 
 
@@ -119,14 +155,20 @@ class IdleAnimator:
         self.reload()
 
     def reload(self):
-        self._frames = sorted(self.frames_dir.glob("frame_*.png"))
-        if not self._frames:
+        paths = sorted(self.frames_dir.glob("frame_*.png"), key=_frame_sort_key)
+        if not paths:
             raise FileNotFoundError(f"No frames found in {self.frames_dir}")
+        # Decode + convert each PNG once; tick() then just indexes RAM
+        # images instead of hitting the SD card every frame, forever.
+        self._frames = [Image.open(p).convert("1").copy() for p in paths]
         self._idx = 0
+        self._last_idx = None       # last frame actually pushed to the panel
         self._last_ts = 0.0
 
     def enable(self, reset=True):
         self.enabled = True
+        # A UI screen may have overwritten the panel while disabled
+        self._last_idx = None
         if reset:
             self._idx = 0
             self._last_ts = 0.0
@@ -135,7 +177,7 @@ class IdleAnimator:
         self.enabled = False
 
     def _safe_display(self, img: Image.Image) -> bool:
-        img = img.convert("1")
+        # Frames are converted to mode "1" at load time
         for _ in range(self.retries):
             try:
                 self.oled.device.display(img)
@@ -147,13 +189,15 @@ class IdleAnimator:
     def tick(self) -> bool:
         if not self.enabled:
             return False
-        now = time.time()
+        now = time.monotonic()
         interval = 1.0 / self.fps if self.fps > 0 else 0.0
         if (now - self._last_ts) < interval:
             return False
-        fp = self._frames[self._idx]
-        img = Image.open(fp)
-        ok = self._safe_display(img)
+        if self._idx == self._last_idx:     # same frame (e.g. 1-frame set): skip the I2C push
+            ok = True
+        else:
+            ok = self._safe_display(self._frames[self._idx])
+            self._last_idx = self._idx
         self._last_ts = now
         self._idx = (self._idx + self.step) % len(self._frames)
         return ok
@@ -162,18 +206,9 @@ class IdleAnimator:
 # =========================
 # Helpers
 # =========================
-def load_json(path: Path) -> dict:
-    if path.exists():
-        return json.loads(path.read_text())
-    return {}
-
-def save_json(path: Path, data: dict) -> None:
-    path.write_text(json.dumps(data, indent=2))
-
 def load_users_from_csv(csv_path: Path) -> list[dict]:
     if not csv_path.exists():
         raise FileNotFoundError(f"User list CSV not found: {csv_path}")
-    import csv
     with csv_path.open("r", newline="", encoding="utf-8") as f:
         reader = csv.DictReader(f)
         users = [row for row in reader]
@@ -181,65 +216,110 @@ def load_users_from_csv(csv_path: Path) -> list[dict]:
         raise ValueError("CSV is empty.")
     return users
 
+# Parsed CSV memo keyed on (mtime, size): repeat calls cost one stat
+# instead of a full re-parse when the file hasn't changed.
+_csv_cache: dict[Path, tuple[float, int, dict]] = {}
+
 def load_code_to_name(csv_path: Path) -> dict:
-    users = load_users_from_csv(csv_path)
-    out = {}
-    for row in users:
-        code = (row.get(USER_CODE_COL) or "").strip()
-        name = (row.get(USER_NAME_COL) or "").strip()
-        if code:
-            out[code] = name or "UNKNOWN"
+    if not csv_path.exists():
+        raise FileNotFoundError(f"User list CSV not found: {csv_path}")
+    st = csv_path.stat()
+    cached = _csv_cache.get(csv_path)
+    if cached is not None and cached[0] == st.st_mtime and cached[1] == st.st_size:
+        return cached[2]
+
+    with csv_path.open("r", newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            raise ValueError("CSV is empty.")
+        code_idx = header.index(USER_CODE_COL)
+        name_idx = header.index(USER_NAME_COL) if USER_NAME_COL in header else None
+        out = {}
+        # csv.reader + resolved indices skips DictReader's per-row dict
+        for row in reader:
+            if len(row) <= code_idx:
+                continue
+            code = row[code_idx].strip()
+            if code:
+                name = row[name_idx].strip() if name_idx is not None and len(row) > name_idx else ""
+                out[code] = name or "UNKNOWN"
+
+    _csv_cache[csv_path] = (st.st_mtime, st.st_size, out)
     return out
 
+# One worker thread owns all Notion writes: the handlers just enqueue,
+# so a slow or down WiFi link never stalls the OLED, and there is no
+# per-event thread spawn. Bounded queue so a long outage can't grow
+# memory without limit.
+_NOTION_Q = queue.Queue(maxsize=256)
+_notion_thread = None
+
+# Batch caps: wait up to 500 ms for stragglers, never more than 8 per
+# batch so per-event latency stays bounded during a rush.
+_NOTION_BATCH_MAX = 8
+_NOTION_BATCH_WINDOW = 0.5
+
+def _notion_worker():
+    _pin_to_core(2)         # network worker off the UI and finger cores
+    pool = ThreadPoolExecutor(max_workers=4)
+    while True:
+        batch = [_NOTION_Q.get()]
+        deadline = time.monotonic() + _NOTION_BATCH_WINDOW
+        while len(batch) < _NOTION_BATCH_MAX:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(_NOTION_Q.get(timeout=remaining))
+            except queue.Empty:
+                break
+        if len(batch) == 1:
+            write_to_notion_reason_only(*batch[0])
+        else:
+            # Overlap the HTTPS round-trips over the pooled session
+            list(pool.map(lambda args: write_to_notion_reason_only(*args), batch))
+
 def log_to_notion_reason_only(code: str, action: str) -> None:
-    """Log ONLY to Notion Reason column, nothing else."""
-    def write_notion_async():
-        write_to_notion_reason_only(code, action)
-    thread = threading.Thread(target=write_notion_async, daemon=True)
-    thread.start()
-
-def _short(s: str, max_len: int = 21) -> str:
-    s = (s or "").strip()
-    return s if len(s) <= max_len else (s[: max_len - 1] + ".")
-
-def finger_lookup(finger_id: int) -> tuple:
-    finger_code_map = load_json(MAP_FILE)
-    code = finger_code_map.get(str(finger_id))
-    if not code:
-        return (False, None, None)
-    name = load_code_to_name(USERS_CSV).get(code, "UNKNOWN")
-    return (True, code, name)
+    """Queue a Notion Reason write for the background worker."""
+    global _notion_thread
+    if _notion_thread is None:
+        _notion_thread = threading.Thread(target=_notion_worker, daemon=True)
+        _notion_thread.start()
+    try:
+        _NOTION_Q.put_nowait((code, action))
+    except queue.Full:
+        log.info("Notion queue full; dropping event")
 
 # =========================
 # IN/OUT Status Functions
 # =========================
+# Backed by the SQLite store: one indexed read/upsert per event instead
+# of parsing and rewriting current_status.json every time. The daily
+# reset is implicit (rows stamped with a previous day read as OUT).
+_store = None
+
+def _get_store() -> CheckinStore:
+    global _store
+    if _store is None:
+        _store = CheckinStore()
+    return _store
+
 def get_user_status(user_code: str) -> str:
-    status_data = load_json(CURRENT_STATUS)
-    today = datetime.now().strftime("%Y-%m-%d")
-    if "last_reset" not in status_data or status_data["last_reset"] != today:
-        status_data = {"last_reset": today}
-        save_json(CURRENT_STATUS, status_data)
-        return "OUT"
-    return status_data.get(user_code, "OUT")
+    return _get_store().get_status(user_code)
 
 def update_user_status(user_code: str, action: str):
-    status_data = load_json(CURRENT_STATUS)
-    today = datetime.now().strftime("%Y-%m-%d")
-    if "last_reset" not in status_data or status_data["last_reset"] != today:
-        status_data = {"last_reset": today}
-    status_data[user_code] = action
-    save_json(CURRENT_STATUS, status_data)
+    _get_store().set_status(user_code, action)
 
 
 # =========================
 # Finger scan background thread
 # =========================
 class FingerWorker(threading.Thread):
-    def __init__(self, sensor: FingerVeinSensor, out_q: queue.Queue, lock: threading.Lock):
+    def __init__(self, sensor: FingerVeinSensor, out_q: queue.Queue):
         super().__init__(daemon=True)
         self.sensor = sensor
         self.out_q = out_q
-        self.lock = lock
         self._stop = threading.Event()
         self.last_reported_fid = -1
         self.last_detection_time = 0
@@ -248,25 +328,20 @@ class FingerWorker(threading.Thread):
         self._stop.set()
 
     def run(self):
+        _pin_to_core(1)     # keep the event queue's producer cache-stable
+        # Sole owner of the sensor serial port while the app runs;
+        # verify_and_get_id's own serial timeout paces the polling.
         while not self._stop.is_set():
-            got = self.lock.acquire(timeout=0.2)
-            if not got:
-                continue
             try:
                 fid = self.sensor.verify_and_get_id(user_id=0)
                 if fid >= 0:
-                    now = time.time()
+                    now = time.monotonic()
                     if fid != self.last_reported_fid or (now - self.last_detection_time) > 2.0:
                         self.last_reported_fid = fid
                         self.last_detection_time = now
-                        self.out_q.put(("finger_ok", fid))
+                        self.out_q.put(("fg", "finger_ok", fid))
             except Exception:
                 time.sleep(0.2)
-            finally:
-                try:
-                    self.lock.release()
-                except RuntimeError:
-                    pass
 
 
 # =========================
@@ -274,7 +349,12 @@ class FingerWorker(threading.Thread):
 # =========================
 class App:
     def __init__(self):
+        # Pre-set so shutdown() stays deterministic if construction
+        # fails partway; None checks replace per-call hasattr probes.
+        self.fw = self.sensor = None
+        self._sensor_close = None
         self.oled = OLED()
+        self.oled.start_renderer()      # show_lines posts a frame and returns
         self.keypad = KeypadUART(KEYPAD_PORT, KEYPAD_BAUD)
         self.idle = IdleAnimator(
             oled=self.oled,
@@ -284,6 +364,8 @@ class App:
             retries=IDLE_RETRIES
         )
         self.sensor = FingerVeinSensor(baud_index=3)
+        # Manufacturer close hook, resolved once (None on this wrapper)
+        self._sensor_close = getattr(self.sensor, "CloseConnectDev", None)
         ret = self.sensor.connect(SENSOR_PASSWORD)
         
         if ret != 0:
@@ -297,80 +379,103 @@ class App:
 
         self.code_to_name = load_code_to_name(USERS_CSV)
         self.state = "IDLE"
+        self.result_expires_at = 0.0    # deadline for SHOW_RESULT screens
         self.buf = ""
-        self.last_ts = time.time()
+        self.last_ts = time.monotonic()
         self.last_finger_time = 0
         self.finger_cooldown = FINGER_COOLDOWN
-        self.fq = queue.Queue()
-        self.fw = FingerWorker(self.sensor, self.fq, SENSOR_LOCK)
+        # Single event queue fed by the keypad pump thread ("kp" entries)
+        # and the finger worker ("fg" entries); run() blocks on it instead
+        # of sleep-polling both sources.
+        self._event_q = queue.Queue()
+        self.fw = FingerWorker(self.sensor, self._event_q)
         self.fw.start()
         self._init_daily_status()
         self._check_notion_config()
         self.enter_idle()
 
     def _init_daily_status(self):
-        today = datetime.now().strftime("%Y-%m-%d")
-        status_data = load_json(CURRENT_STATUS)
-        if "last_reset" not in status_data or status_data["last_reset"] != today:
-            status_data = {"last_reset": today}
-            save_json(CURRENT_STATUS, status_data)
-            print(f"New day: {today}, all users set to OUT")
+        # Opens (and creates if needed) the status store up front; stale
+        # rows from previous days already read as OUT.
+        _get_store()
+        log.info(f"Status store ready for {datetime.now().strftime('%Y-%m-%d')}")
 
     def _check_notion_config(self):
         if not NOTION_KEY:
-            print("WARNING: NOTION_KEY not set")
+            log.info("WARNING: NOTION_KEY not set")
             self.oled.show_lines(["NOTION WARNING", "API Key Missing", "Logging disabled", ""])
             time.sleep(2)
         elif not NOTION_DATABASE_ID:
-            print("WARNING: DATABASE_ID not set")
+            log.info("WARNING: DATABASE_ID not set")
             self.oled.show_lines(["NOTION WARNING", "DB ID Missing", "Logging disabled", ""])
             time.sleep(2)
         else:
-            print("Notion integration configured")
-            try:
-                url = f"https://api.notion.com/v1/databases/{NOTION_DATABASE_ID}"
-                response = requests.get(url, headers=NOTION_HEADERS, timeout=3)
-                if response.status_code == 200:
-                    print("Notion connection successful")
-                else:
-                    print(f"Notion connection issue: {response.status_code}")
-            except Exception as e:
-                print(f"Notion connection test failed: {e}")
+            log.info("Notion integration configured")
+            # Probe in the background so boot never blocks on the network
+            threading.Thread(target=self._probe_notion, daemon=True).start()
+
+    def _probe_notion(self):
+        cached = load_json(NOTION_CHECK_CACHE)
+        if cached.get("ok") and time.time() - cached.get("checked_at", 0) < NOTION_CHECK_TTL:
+            log.info("Notion connection OK (cached)")
+            return
+        try:
+            url = f"https://api.notion.com/v1/databases/{NOTION_DATABASE_ID}"
+            response = NOTION_SESSION.get(url, timeout=3)
+            if response.status_code == 200:
+                log.info("Notion connection successful")
+                save_json(NOTION_CHECK_CACHE, {"ok": True, "checked_at": time.time()})
+            else:
+                log.info(f"Notion connection issue: {response.status_code}")
+        except Exception as e:
+            log.info(f"Notion connection test failed: {e}")
 
     def shutdown(self):
-        print("\nShutting down system...")
-        if hasattr(self, 'fw') and self.fw:
+        log.info("\nShutting down system...")
+        if self.fw is not None:
             try:
-                print("Stopping finger worker thread...")
+                log.info("Stopping finger worker thread...")
                 self.fw.stop()
                 self.fw.join(timeout=1.0)
-                print("Finger worker stopped")
+                log.info("Finger worker stopped")
             except Exception as e:
-                print(f"Error stopping finger worker: {e}")
-        if hasattr(self, 'sensor') and self.sensor:
+                log.info(f"Error stopping finger worker: {e}")
+        if self.sensor is not None:
             try:
-                print("Shutting down sensor...")
-                if hasattr(self.sensor, 'CloseConnectDev'):
-                    ret = self.sensor.CloseConnectDev(3000)
-                    print(f"CloseConnectDev returned: {ret}")
+                log.info("Shutting down sensor...")
+                if self._sensor_close is not None:
+                    ret = self._sensor_close(3000)
+                    log.info(f"CloseConnectDev returned: {ret}")
                 else:
                     self.sensor.shutdown()
-                    print("Sensor shutdown complete")
+                    log.info("Sensor shutdown complete")
             except Exception as e:
-                print(f"Error during sensor shutdown: {e}")
+                log.info(f"Error during sensor shutdown: {e}")
         try:
             self.oled.clear()
-            print("OLED cleared")
+            log.info("OLED cleared")
         except:
             pass
-        print("System shutdown complete")
+        log.info("System shutdown complete")
 
     def clear_finger_queue(self):
-        try:
-            while True:
-                self.fq.get_nowait()
-        except queue.Empty:
-            pass
+        # Drop pending finger events but keep queued keypad input, in a
+        # single pass on the underlying deque under the queue's own
+        # mutex -- no get/put churn per entry.
+        with self._event_q.mutex:
+            kept = [e for e in self._event_q.queue if e[0] != "fg"]
+            self._event_q.queue.clear()
+            self._event_q.queue.extend(kept)
+
+    def _show_result(self, duration: float):
+        """Hold the current screen without blocking the event loop.
+
+        Replaces the time.sleep() tails in the handlers: run() keeps
+        consuming events while the screen is up and drops back to idle
+        when the deadline passes.
+        """
+        self.state = "SHOW_RESULT"
+        self.result_expires_at = time.monotonic() + duration
 
     def enter_idle(self):
         self.state = "IDLE"
@@ -384,8 +489,15 @@ class App:
         self.exit_idle()
         self.oled.show_lines(["ENTER CODE:", self.buf, "ENTER=submit", "BACK=delete"])
 
+    def finger_lookup(self, finger_id: int) -> tuple:
+        # The registry holds the parsed map and re-stats it per access
+        code = finger_registry.get_finger_map().get(str(finger_id))
+        if not code:
+            return (False, None, None)
+        return (True, code, self.code_to_name.get(code, "UNKNOWN"))
+
     def handle_finger(self, finger_id: int):
-        now = time.time()
+        now = time.monotonic()
         if (now - self.last_finger_time) < self.finger_cooldown:
             self.clear_finger_queue()
             return
@@ -393,12 +505,11 @@ class App:
         self.last_finger_time = now
         self.exit_idle()
         
-        enrolled, code, name = finger_lookup(finger_id)
+        enrolled, code, name = self.finger_lookup(finger_id)
         
         if not enrolled:
             #self.oled.show_lines(["UNKNOWN FINGER", "NOT ENROLLED", "", ""])
-            time.sleep(1.5)
-            self.enter_idle()
+            self._show_result(1.5)
             return
 
         self.clear_finger_queue()
@@ -409,36 +520,22 @@ class App:
         log_to_notion_reason_only(code, action)
         update_user_status(code, action)
         
-        t_now = datetime.now().strftime("%H:%M")
-        if action == "IN":
-            self.oled.show_lines([
-                f"WELCOME {_short(name)}!",
-                f"Code: {code}",
-                f"Time: {t_now}",
-                "Status: CLOCKED IN"
-            ])
-        else:
-            self.oled.show_lines([
-                f"GOODBYE {_short(name)}!",
-                f"Code: {code}",
-                f"Time: {t_now}",
-                "Status: CLOCKED OUT"
-            ])
-        
-        time.sleep(3)
-        self.enter_idle()
+        # Static banner/labels come from a cached template; only the
+        # name, code and time strings are rasterized per scan.
+        self.oled.show_status(action, _short(name), code, _hhmm())
+
+        self._show_result(3.0)
 
     def handle_code_submit(self):
-        self.last_finger_time = time.time()
+        self.last_finger_time = time.monotonic()
         self.exit_idle()
         
         code = self.buf
         name = self.code_to_name.get(code)
         
         if not name:
-            self.oled.show_lines(["DENIED", "Invalid code", "", ""])
-            time.sleep(1.5)
-            self.enter_idle()
+            self.oled.show_lines_sync(["DENIED", "Invalid code", "", ""])
+            self._show_result(1.5)
             return
 
         current_status = get_user_status(code)
@@ -448,24 +545,44 @@ class App:
         log_to_notion_reason_only(code, action)
         update_user_status(code, action)
         
-        t_now = datetime.now().strftime("%H:%M")
-        if action == "IN":
-            self.oled.show_lines([
-                f"WELCOME {_short(name)}!",
-                f"Code: {code}",
-                f"Time: {t_now}",
-                "Status: CLOCKED IN"
-            ])
-        else:
-            self.oled.show_lines([
-                f"GOODBYE {_short(name)}!",
-                f"Code: {code}",
-                f"Time: {t_now}",
-                "Status: CLOCKED OUT"
-            ])
-        
-        time.sleep(3)
-        self.enter_idle()
+        # Static banner/labels come from a cached template; only the
+        # name, code and time strings are rasterized per scan.
+        self.oled.show_status(action, _short(name), code, _hhmm())
+
+        self._show_result(3.0)
+
+    def _keypad_pump(self):
+        # Blocks in the kernel until UART bytes arrive, then forwards the
+        # decoded events; zero CPU while no one is typing.
+        while True:
+            for ev, val in self.keypad.wait_events(None):
+                self._event_q.put(("kp", ev, val))
+
+    def _handle_keypad_event(self, ev, val):
+        if ev == "key":
+            if self.state == "IDLE":
+                self.exit_idle()
+                self.state = "ENTERING"
+                self.buf = ""
+            if self.state == "ENTERING" and val in _DIGITS and len(self.buf) < 5:
+                self.buf += str(val)
+                self.last_ts = time.monotonic()
+                self.show_buf()
+        elif ev == "back":
+            if self.state == "ENTERING" and self.buf:
+                self.buf = self.buf[:-1]
+                self.last_ts = time.monotonic()
+                self.show_buf()
+            elif self.state == "ENTERING" and not self.buf:
+                self.enter_idle()
+        elif ev == "enter":
+            if self.state == "ENTERING":
+                if len(self.buf) != 5:
+                    self.exit_idle()
+                    self.oled.show_lines_sync(["INVALID", "Need 5 digits", "", ""])
+                    self._show_result(1.0)
+                else:
+                    self.handle_code_submit()
 
     def run(self):
         self.exit_idle()
@@ -473,55 +590,51 @@ class App:
             self.oled.show_lines(["ATTENDANCE SYSTEM", "Ready for scans", "Code or Finger", "Notion: ONLINE"])
         else:
             self.oled.show_lines(["ATTENDANCE SYSTEM", "Ready for scans", "Code or Finger", "Notion: OFFLINE"])
-        
+
         time.sleep(2)
         self.enter_idle()
-        
+
+        threading.Thread(target=self._keypad_pump, daemon=True).start()
+
+        idle_interval = 1.0 / IDLE_FPS if IDLE_FPS > 0 else 0.5
         while True:
             if self.state == "IDLE":
                 self.idle.tick()
 
-            for ev, val in self.keypad.poll():
-                if ev == "key":
-                    if self.state == "IDLE":
-                        self.exit_idle()
-                        self.state = "ENTERING"
-                        self.buf = ""
-                    if self.state == "ENTERING" and val and str(val).isdigit() and len(self.buf) < 5:
-                        self.buf += str(val)
-                        self.last_ts = time.time()
-                        self.show_buf()
-                elif ev == "back":
-                    if self.state == "ENTERING" and self.buf:
-                        self.buf = self.buf[:-1]
-                        self.last_ts = time.time()
-                        self.show_buf()
-                    elif self.state == "ENTERING" and not self.buf:
-                        self.enter_idle()
-                elif ev == "enter":
-                    if self.state == "ENTERING":
-                        if len(self.buf) != 5:
-                            self.exit_idle()
-                            self.oled.show_lines(["INVALID", "Need 5 digits", "", ""])
-                            time.sleep(1.0)
-                            self.enter_idle()
-                        else:
-                            self.handle_code_submit()
-
-            if self.state == "ENTERING" and (time.time() - self.last_ts) > 10:
-                self.enter_idle()
+            # Result screens expire here instead of blocking in sleep()
+            if self.state == "SHOW_RESULT":
+                remaining = self.result_expires_at - time.monotonic()
+                if remaining <= 0:
+                    self.enter_idle()
 
+            # Block until an event or the next deadline (idle frame /
+            # result expiry / typing-timeout check) instead of waking 50
+            # times a second.
+            if self.state == "IDLE":
+                timeout = idle_interval
+            elif self.state == "SHOW_RESULT":
+                timeout = max(0.0, self.result_expires_at - time.monotonic())
+            else:
+                timeout = 0.5
             try:
-                while True:
-                    fev, fid = self.fq.get_nowait()
-                    if fev == "finger_ok":
+                event = self._event_q.get(timeout=timeout)
+            except queue.Empty:
+                event = None
+
+            if event is not None:
+                if event[0] == "kp":
+                    if self.state != "SHOW_RESULT":
+                        _, ev, val = event
+                        self._handle_keypad_event(ev, val)
+                elif event[0] == "fg":
+                    _, fev, fid = event
+                    if fev == "finger_ok" and self.state != "SHOW_RESULT":
                         self.state = "IDLE"
                         self.buf = ""
                         self.handle_finger(int(fid))
-            except queue.Empty:
-                pass
 
-            time.sleep(0.02)
+            if self.state == "ENTERING" and (time.monotonic() - self.last_ts) > 10:
+                self.enter_idle()
 
 
 def main():
@@ -530,9 +643,9 @@ def main():
         app = App()
         app.run()
     except KeyboardInterrupt:
-        print("\nShutting down via Ctrl+C...")
+        log.info("\nShutting down via Ctrl+C...")
     except Exception as e:
-        print(f"Error: {e}")
+        log.info(f"Error: {e}")
     finally:
         if app:
             app.shutdown()
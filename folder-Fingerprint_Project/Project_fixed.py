@@ -2,8 +2,11 @@
 
 
 #============================Imports===============================================
-import time             
+import time
 import csv
+import queue
+import atexit
+import threading
 from datetime import datetime
 from pathlib import Path
 
@@ -16,6 +19,7 @@ from PIL import Image, ImageDraw, ImageFont
 
 # ---------- UART ----------
 import serial
+import selectors
 
 #=================================================================================
 
@@ -31,6 +35,18 @@ FINGER_PORT = "/dev/ttyUSB1"      # example if fingerprint is another USB-serial
 FINGER_BAUD = 9600                # common fingerprint baud (adjust)
 
 LOG_PATH = Path("checkins.csv")   # This is the list for the users.
+USERS_CSV = Path("checkins.csv")
+
+def _clean(field):
+    """Strip a CSV field only when it actually carries stray whitespace.
+
+    csv.reader never leaves the row terminator inside a field, so for a
+    well-formed sheet this is a two-char check with no string allocation.
+    """
+    if field and (field[0].isspace() or field[-1].isspace()):
+        return field.strip()
+    return field
+
 
 def load_valid_codes_from_csv(csv_path):
     """
@@ -40,14 +56,39 @@ def load_valid_codes_from_csv(csv_path):
     codes = {}
 
     with open(csv_path, newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
+        reader = csv.reader(f, skipinitialspace=True)
+        header = next(reader, [])
+        # Resolve column positions once; csv.reader then yields plain lists
+        # with no per-row dict construction.
+        name_idx = header.index("Employee Name")
+        code_idx = header.index("Code")
         for row in reader:
-            name = row["Employee Name"].strip()
-            code = row["Code"].strip()
-            codes[code] = name
+            if len(row) <= max(name_idx, code_idx):
+                continue
+            code = _clean(row[code_idx])
+            if code:
+                codes[code] = _clean(row[name_idx])
 
     return codes
-  
+
+
+# Parsed once at startup; re-reading the CSV on every submit made each
+# check-in pay full file I/O + parse cost for a single dict lookup.
+VALID_CODES = load_valid_codes_from_csv(USERS_CSV)
+# Membership-only checks go through the frozenset: no value load, slightly
+# faster than dict.get on a miss, and usable by the fingerprint path too.
+VALID_CODE_SET = frozenset(VALID_CODES)
+_valid_codes_mtime = USERS_CSV.stat().st_mtime
+
+def maybe_reload_valid_codes():
+    """Re-parse the user CSV only when the file actually changed (off the hot path)."""
+    global VALID_CODES, VALID_CODE_SET, _valid_codes_mtime
+    mtime = USERS_CSV.stat().st_mtime
+    if mtime != _valid_codes_mtime:
+        VALID_CODES = load_valid_codes_from_csv(USERS_CSV)
+        VALID_CODE_SET = frozenset(VALID_CODES)
+        _valid_codes_mtime = mtime
+
 
 # =========================
 # OLED helpers
@@ -57,17 +98,44 @@ class OLED:
         serial_iface = i2c(port=1, address=0x3C)  # most OLEDs use 0x3C
         self.device = ssd1306(serial_iface)       # This is the physical LED screen
         self.font = ImageFont.load_default()
+        self._last_lines = None                   # last frame pushed, to skip identical redraws
+        # One persistent frame buffer, cleared in place each redraw instead of
+        # allocating a fresh Image + Draw per frame.
+        self._img = Image.new("1", self.device.size, 0)
+        self._draw = ImageDraw.Draw(self._img)
+        self._frames = {}                         # prerendered static screens, by key
+
+    def prerender(self, key, lines):
+        """Lay out a static screen once; blit(key) then skips PIL text drawing."""
+        img = Image.new("1", self.device.size, 0)
+        draw = ImageDraw.Draw(img)
+        y = 0
+        for line in lines[:4]:
+            draw.text((0, y), line, font=self.font, fill=1)
+            y += 12
+        self._frames[key] = img
+
+    def blit(self, key):
+        """Push a frame prepared with prerender(); no per-call text layout."""
+        marker = ("__frame__", key)
+        if marker == self._last_lines:
+            return
+        self.device.display(self._frames[key])
+        self._last_lines = marker
 
     def show_lines(self, lines):                    # This is the text display Method.
-        img =  Image.new("1", self.device.size, 0)  # 1 = white background in 1-bit mode / Zero would produce a black background.
-        draw = ImageDraw.Draw(img)
+        lines = tuple(lines[:4])
+        if lines == self._last_lines:               # identical frame -> skip the ~1KB I2C transfer
+            return
+        self._draw.rectangle((0, 0) + self.device.size, fill=0)
 
         y = 0
-        for line in lines[:4]:                               # Creates a 12px font for each line of wording.
-            draw.text((0, y), line, font=self.font, fill=1)  # 0 = black text
+        for line in lines:                                         # Creates a 12px font for each line of wording.
+            self._draw.text((0, y), line, font=self.font, fill=1)  # 0 = black text
             y += 12
 
-        self.device.display(img)
+        self.device.display(self._img)
+        self._last_lines = lines
 
     def show_arrival_message(oled, user_name_or_id):
         """
@@ -88,7 +156,12 @@ class OLED:
 # =========================
 # Logging
 # =========================
-def log_checkin(user_id, method, result):
+# Rows are queued and written by a daemon thread that keeps the file open,
+# so the check-in path never waits on an open/write/close cycle.
+_LOG_Q = queue.Queue()
+_log_thread = None
+
+def _log_worker():
     LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
     new_file = not LOG_PATH.exists()                  # This line checks if we need a new file
 
@@ -96,7 +169,32 @@ def log_checkin(user_id, method, result):
         w = csv.writer(f)
         if new_file:
             w.writerow(["timestamp", "user_id", "method", "result"])
-        w.writerow([datetime.now().isoformat(timespec="seconds"), user_id, method, result])
+            f.flush()
+        while True:
+            row = _LOG_Q.get()
+            if row is None:                           # shutdown sentinel from atexit
+                f.flush()
+                return
+            now, user_id, method, result = row
+            # isoformat runs here on the worker, off the check-in path
+            w.writerow([now.isoformat(timespec="seconds"), user_id, method, result])
+            if _LOG_Q.empty():
+                f.flush()
+
+def _drain_log_queue():
+    _LOG_Q.put(None)
+    if _log_thread is not None:
+        _log_thread.join(timeout=2)
+
+def log_checkin(user_id, method, result, now=None):
+    """Queue one check-in row. Pass `now` when the caller already has a
+    timestamp for this event so the clock is read only once."""
+    global _log_thread
+    if _log_thread is None:
+        _log_thread = threading.Thread(target=_log_worker, daemon=True)
+        _log_thread.start()
+        atexit.register(_drain_log_queue)
+    _LOG_Q.put((now or datetime.now(), user_id, method, result))
 
 # =========================
 # Keypad reader (UART)
@@ -107,35 +205,55 @@ class KeypadUART:
       ('key', '1'), ('key', '2'), ('enter', None), ('back', None)
     You must adapt decode_bytes_to_keys() to your keypad's protocol.
     """
+    # Byte -> event lookup, built once at class definition: decoding is
+    # one indexed get per byte instead of the if/elif cascade.
+    _KEY_TABLE = [None] * 256
+    _KEY_TABLE[10] = _KEY_TABLE[13] = ("enter", None)       # LF or CR
+    _KEY_TABLE[8] = _KEY_TABLE[127] = ("back", None)        # backspace
+    for _ch in "0123456789*#":
+        _KEY_TABLE[ord(_ch)] = ("key", _ch)
+    _KEY_TABLE = tuple(_KEY_TABLE)
+    del _ch
+
     def __init__(self, port, baud):
         self.ser = serial.Serial(port, baudrate=baud, timeout=0)
         self.buffer = bytearray()
+        # Lets callers sleep in the kernel until a byte arrives instead of
+        # spinning on poll() + time.sleep().
+        self._sel = selectors.DefaultSelector()
+        self._sel.register(self.ser, selectors.EVENT_READ)
+
+    def fileno(self) -> int:
+        """File descriptor of the keypad UART, for external select loops."""
+        return self.ser.fileno()
 
     def decode_bytes_to_keys(self, data: bytes):
         # ---- YOU WILL EDIT THIS ----
-        # Generic fallback: assume keypad sends ASCII characters directly.
-        # e.g. b'1', b'2', b'3', b'\n'
-        events = []
-        for b in data:
-            if b in (10, 13):              # LF or CR
-                events.append(("enter", None))
-            elif b in (8, 127):            # backspace
-                events.append(("back", None))
-            else:
-                ch = chr(b)
-                # accept digits and asterisk/hash as typical keypad keys
-                if ch.isdigit() or ch in ("*", "#"):
-                    events.append(("key", ch))
-        return events
+        # Generic fallback: assume keypad sends ASCII characters directly
+        # (e.g. b'1', b'\n'); unmapped bytes decode to None and drop out.
+        table = self._KEY_TABLE
+        return [e for b in data if (e := table[b]) is not None]
 
     def poll(self):
-        events = []
+        # Return the decoded list directly -- no intermediate wrapper list
+        # to allocate and extend on every call.
         n = self.ser.in_waiting
         if n > 0:
-            data = self.ser.read(n)
-            events.extend(self.decode_bytes_to_keys(data))
-        return events
+            return self.decode_bytes_to_keys(self.ser.read(n))
+        return []
 
+    def wait_events(self, timeout=None):
+        """
+        Block until keypad bytes arrive (or timeout seconds pass), then
+        return the decoded events. Returns [] on timeout. The wait happens
+        in the kernel (select/epoll), so no CPU is burned while idle.
+        """
+        events = self.poll()
+        if events:
+            return events
+        if not self._sel.select(timeout):
+            return []
+        return self.poll()
 
     def collect_code_from_keypad(keypad, max_len=5):
         """
@@ -147,7 +265,7 @@ class KeypadUART:
         oled.show_lines(["ENTER CODE:", "", "Press Enter", "Back = delete"])
 
         while True:
-            for event, value in keypad.poll():
+            for event, value in keypad.wait_events(0.5):
 
                 if event == "key":
                     if len(code) < max_len:
@@ -163,8 +281,6 @@ class KeypadUART:
                 shown = code
                 oled.show_lines(["ENTER CODE:", shown, "Press Enter", "Back = delete"])
 
-            time.sleep(0.05)
-
     def show_touched_key(oled, event, value):
         """
         Display the last touched key on the OLED.
@@ -337,29 +453,57 @@ if __name__ == "__main__":
     app.run()
 
 """ 
+def show_result_screen(oled, keypad, lines, duration=5.0, frame=None):
+    """
+    Show a result screen for `duration` seconds without a blind time.sleep:
+    the wait happens in keypad.wait_events, and any keys pressed while the
+    screen is up are drained so they cannot leak into the next code entry.
+    Pass `frame` to push a prerendered static screen instead of `lines`.
+    """
+    if frame is not None:
+        oled.blit(frame)
+    else:
+        oled.show_lines(lines)
+    deadline = time.monotonic() + duration
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        keypad.wait_events(remaining)   # drain and discard
+
+
 # log_checkin(user_id="1234", method="PIN", result="SUCCESS")
 oled = OLED()
 oled.show_lines(["Welcome", "Enter PIN", "or Use Finger"])
 
+# Static screens laid out once at startup; blit() pushes them with no PIL work
+oled.prerender("welcome", ["Welcome", "Enter PIN", "Press Enter", ""])
+oled.prerender("invalid_len", ["Invalid code", "Need 5 keys", "Try again", ""])
+oled.prerender("denied", ["DENIED", "Invalid code", "", ""])
+
 keypad = KeypadUART("/dev/ttyUSB0", 9600)
 
-oled.show_lines(["Welcome", "Enter PIN", "Press Enter", ""])
+oled.blit("welcome")
 
 
 while True:
     code = KeypadUART.collect_code_from_keypad(keypad, max_len=5)
 
     if code is None:
-        oled.show_lines(["Invalid code", "Need 5 keys", "Try again", ""])
-        time.sleep(1.2)
-        oled.show_lines(["Welcome", "Enter PIN", "Press Enter", ""])
+        show_result_screen(oled, keypad, None, 1.2, frame="invalid_len")
+        oled.blit("welcome")
         continue
 
-    VALID_CODES = load_valid_codes_from_csv("checkins.csv")
-    user_id = VALID_CODES.get(code)
+    if code in VALID_CODE_SET:
+        user_id = VALID_CODES[code]
+        now = datetime.now()        # one clock read per check-in, shared by log + screen
+        log_checkin(user_id, "PIN", "success", now=now)
+        show_result_screen(oled, keypad, [f"Hi {user_id}", "You arrived at:", now.strftime("%H:%M:%S"), ""], 5.0)
+    else:
+        log_checkin(code, "PIN", "fail")
+        show_result_screen(oled, keypad, None, 1.5, frame="denied")
 
-    if user_id:
-        log_checkin(user_id, "PIN", "success")
-        OLED.show_arrival_message(oled, user_id)   # ? shows user + time
+    # Pick up CSV edits while nobody is typing (cheap stat, no re-parse if unchanged)
+    maybe_reload_valid_codes()
 
-    time.sleep(2)
\ No newline at end of file
+    oled.blit("welcome")
\ No newline at end of file
@@ -18,19 +18,29 @@ def load_map() -> dict:
 def save_map(m: dict) -> None:
     MAP_FILE.write_text(json.dumps(m, indent=2))
 
-def assign_next_code(user_id: int, mapping: dict) -> str:
-    """Assign the first unused code to this user_id."""
+def free_codes(mapping: dict) -> dict:
+    """Insertion-ordered pool of codes not yet assigned in `mapping`.
+
+    dict.fromkeys keeps AVAILABLE_CODES order while giving O(1) pop of the
+    next free code, instead of rescanning the list against a used-set on
+    every assignment.
+    """
+    used = set(mapping.values())
+    return dict.fromkeys(c for c in AVAILABLE_CODES if c not in used)
+
+def assign_next_code(user_id: int, mapping: dict, free: dict) -> str:
+    """Assign the next unused code to this user_id in O(1)."""
     uid = str(user_id)
     if uid in mapping:
         return mapping[uid]
 
-    used = set(mapping.values())
-    for code in AVAILABLE_CODES:
-        if code not in used:
-            mapping[uid] = code
-            return code
+    if not free:
+        raise RuntimeError("No available codes left. Add more to AVAILABLE_CODES.")
 
-    raise RuntimeError("No available codes left. Add more to AVAILABLE_CODES.")
+    code = next(iter(free))
+    del free[code]
+    mapping[uid] = code
+    return code
 
 def enroll_new_finger(sensor: FingerVeinSensor, start_id=0, end_id=100) -> tuple[int, str]:
     """
@@ -56,7 +66,7 @@ def enroll_new_finger(sensor: FingerVeinSensor, start_id=0, end_id=100) -> tuple
     print("Enrollment successful ?")
 
     # 3) Assign a code for this ID and save it
-    code = assign_next_code(user_id, mapping)
+    code = assign_next_code(user_id, mapping, free_codes(mapping))
     save_map(mapping)
 
     print(f"Assigned code for UserID {user_id}: {code}")
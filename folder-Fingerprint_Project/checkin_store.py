@@ -0,0 +1,150 @@
+"""
+SQLite-backed store for check-in state.
+
+Replaces the per-event parse + rewrite of current_status.json (and
+optionally the CSV/JSON maps) with indexed C-level lookups: WAL mode,
+one fsync per durable write, O(1) primary-key reads. Seed it once from
+the existing files with:
+
+    python3 checkin_store.py seed
+"""
+
+import csv
+import sqlite3
+import threading
+from datetime import date, datetime
+from pathlib import Path
+
+try:
+    import orjson as _json
+except ImportError:
+    _json = None
+    import json
+
+DB_FILE = Path("checkin.sqlite")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    code TEXT PRIMARY KEY,
+    name TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS finger_map (
+    finger_id INTEGER PRIMARY KEY,
+    code      TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS attendance (
+    id     INTEGER PRIMARY KEY AUTOINCREMENT,
+    code   TEXT NOT NULL,
+    ts     TEXT NOT NULL,
+    action TEXT NOT NULL,
+    method TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS status (
+    code  TEXT PRIMARY KEY,
+    state TEXT NOT NULL,
+    day   TEXT NOT NULL
+);
+"""
+
+
+class CheckinStore:
+    def __init__(self, db_path: Path = DB_FILE):
+        self.db = sqlite3.connect(str(db_path), check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.executescript(_SCHEMA)
+        # Writes may come from worker threads (Notion/log workers)
+        self._lock = threading.Lock()
+
+    # ---------- lookups ----------
+    def code_to_name(self) -> dict:
+        return dict(self.db.execute("SELECT code, name FROM users"))
+
+    def finger_lookup(self, finger_id: int):
+        """Return (code, name) for an enrolled finger, or None."""
+        return self.db.execute(
+            "SELECT f.code, u.name FROM finger_map f "
+            "LEFT JOIN users u ON u.code = f.code WHERE f.finger_id = ?",
+            (finger_id,),
+        ).fetchone()
+
+    # ---------- IN/OUT status ----------
+    def get_status(self, code: str) -> str:
+        # Rows from a previous day read as OUT: the daily reset is
+        # implicit instead of rewriting a whole JSON file at midnight.
+        row = self.db.execute(
+            "SELECT state, day FROM status WHERE code = ?", (code,)
+        ).fetchone()
+        if row is None or row[1] != date.today().isoformat():
+            return "OUT"
+        return row[0]
+
+    def set_status(self, code: str, action: str) -> None:
+        with self._lock, self.db:
+            self.db.execute(
+                "INSERT INTO status (code, state, day) VALUES (?, ?, ?) "
+                "ON CONFLICT(code) DO UPDATE SET "
+                "state = excluded.state, day = excluded.day",
+                (code, action, date.today().isoformat()),
+            )
+
+    # ---------- attendance ----------
+    def log_attendance(self, code: str, action: str, method: str,
+                       ts: str | None = None) -> None:
+        with self._lock, self.db:
+            self.db.execute(
+                "INSERT INTO attendance (code, ts, action, method) "
+                "VALUES (?, ?, ?, ?)",
+                (code, ts or datetime.now().isoformat(timespec="seconds"),
+                 action, method),
+            )
+
+    # ---------- one-time migration ----------
+    def seed_from_files(self,
+                        users_csv: Path = Path("checkins.csv"),
+                        finger_map_file: Path = Path("finger_code_map.json"),
+                        code_col: str = "Code",
+                        name_col: str = "Employee Name") -> None:
+        """Import the legacy CSV/JSON files; safe to re-run."""
+        with self._lock, self.db:
+            if users_csv.exists():
+                with users_csv.open("r", newline="", encoding="utf-8") as f:
+                    reader = csv.reader(f)
+                    header = next(reader, None) or []
+                    if code_col in header:
+                        code_idx = header.index(code_col)
+                        name_idx = header.index(name_col) if name_col in header else None
+                        for row in reader:
+                            if len(row) <= code_idx or not row[code_idx].strip():
+                                continue
+                            name = (row[name_idx].strip()
+                                    if name_idx is not None and len(row) > name_idx
+                                    else "") or "UNKNOWN"
+                            self.db.execute(
+                                "INSERT OR REPLACE INTO users (code, name) "
+                                "VALUES (?, ?)",
+                                (row[code_idx].strip(), name),
+                            )
+            if finger_map_file.exists():
+                raw = (_json.loads(finger_map_file.read_bytes()) if _json is not None
+                       else json.loads(finger_map_file.read_text()))
+                for fid, code in raw.items():
+                    self.db.execute(
+                        "INSERT OR REPLACE INTO finger_map (finger_id, code) "
+                        "VALUES (?, ?)",
+                        (int(fid), str(code)),
+                    )
+
+    def close(self) -> None:
+        self.db.close()
+
+
+if __name__ == "__main__":
+    import sys
+    if len(sys.argv) > 1 and sys.argv[1] == "seed":
+        store = CheckinStore()
+        store.seed_from_files()
+        store.close()
+        print(f"Seeded {DB_FILE} from checkins.csv + finger_code_map.json")
+    else:
+        print("Usage: python3 checkin_store.py seed")
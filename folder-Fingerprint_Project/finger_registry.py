@@ -0,0 +1,73 @@
+"""
+Shared, mtime-cached access to the finger mapping files.
+
+The main app, FingerCodeReader and Id_fin all used to parse
+finger_code_map.json / user_finger_map.json independently -- duplicate
+reads at startup and duplicate dicts in RAM. This registry loads each
+file once, re-checks a single stat() per access, and reloads only when
+an enrollment rewrites the file. The finger_id reverse index is built
+once and shared by every consumer.
+"""
+
+try:
+    import orjson as _json          # C parser when available
+except ImportError:
+    _json = None
+    import json
+from pathlib import Path
+
+MAP_FILE = Path("finger_code_map.json")
+USER_FINGER_MAP_FILE = Path("user_finger_map.json")
+
+# name -> (mtime, value)
+_cache: dict[str, tuple[float, object]] = {}
+
+
+def _load_json(path: Path) -> dict:
+    try:
+        raw = path.read_bytes()
+    except FileNotFoundError:
+        return {}
+    return _json.loads(raw) if _json is not None else json.loads(raw)
+
+
+def _mtime(path: Path) -> float:
+    try:
+        return path.stat().st_mtime
+    except OSError:
+        return 0.0
+
+
+def _cached(name: str, path: Path, build):
+    mtime = _mtime(path)
+    hit = _cache.get(name)
+    if hit is not None and hit[0] == mtime:
+        return hit[1]
+    value = build(_load_json(path))
+    _cache[name] = (mtime, value)
+    return value
+
+
+def get_finger_map() -> dict:
+    """finger_id (str key) -> code, from finger_code_map.json."""
+    return _cached("finger_map", MAP_FILE, lambda d: d)
+
+
+def get_user_finger_map() -> dict:
+    """CSV code -> {finger_id, code, name}, from user_finger_map.json."""
+    return _cached("user_finger_map", USER_FINGER_MAP_FILE, lambda d: d)
+
+
+def get_by_finger_id() -> dict:
+    """Reverse index finger_id -> {user_key, name, code}, built once."""
+    def build(d: dict) -> dict:
+        return {
+            info["finger_id"]: {
+                "user_key": user_key,
+                "name": info.get("name"),
+                "code": info.get("code"),
+            }
+            for user_key, info in d.items()
+            if "finger_id" in info
+        }
+    return _cached("by_fid", USER_FINGER_MAP_FILE, build)
@@ -1,5 +1,6 @@
-import time
+import ctypes
 import serial
+import selectors
 import serial_comm  # your module that returns the COM port
 
 # -------- Constants (same as yours) --------
@@ -23,26 +24,32 @@ XG_ERR_NO_VEIN = 0x11
 Baudrate = {0: 9600, 1: 19200, 2: 38400, 3: 57600, 4: 115200}
 
 
-class CmdPacket:
+class _Packet(ctypes.LittleEndianStructure):
+    """24-byte wire layout shared by commands and responses.
+
+    bytes(pkt) is a single memcpy of the exact serial framing, so send
+    and receive need no per-field marshalling at all.
+    """
+    _pack_ = 1
+    _fields_ = [
+        ("wPrefix", ctypes.c_uint16),
+        ("bAddress", ctypes.c_uint8),
+        ("bCmd", ctypes.c_uint8),
+        ("bEncode", ctypes.c_uint8),
+        ("bDataLen", ctypes.c_uint8),
+        ("bData", ctypes.c_uint8 * 16),
+        ("wCheckSum", ctypes.c_uint16),
+    ]
+
+
+class CmdPacket(_Packet):
     def __init__(self, address=0x00):
-        self.wPrefix = PREFIX_CODE
-        self.bAddress = address
-        self.bCmd = 0x00
-        self.bEncode = 0x00
-        self.bDataLen = 0x00
-        self.bData = [0x00] * 16
-        self.wCheckSum = 0x000
+        super().__init__(wPrefix=PREFIX_CODE, bAddress=address)
 
 
-class RspPacket:
+class RspPacket(_Packet):
     def __init__(self, address=0x00):
-        self.wPrefix = PREFIX_CODE
-        self.bAddress = address
-        self.bCmd = 0x00
-        self.bEncode = 0x00
-        self.bDataLen = 0x00
-        self.bData = [0x00] * 16
-        self.wCheckSum = 0x000
+        super().__init__(wPrefix=PREFIX_CODE, bAddress=address)
 
 
 class FingerVeinSensor:
@@ -53,8 +60,7 @@ class FingerVeinSensor:
 
     def __init__(self, port=None, baud_index=3, address=0x00, timeout=1):
         self.address = address
-        self.cmd_buf = [0x00] * 24
-        self.rsp_raw = [0x00] * 24
+        self.rsp_raw = bytes(24)
         self.CMD = CmdPacket(address=address)
         self.RSP = RspPacket(address=address)
 
@@ -69,31 +75,23 @@ class FingerVeinSensor:
             timeout=timeout
         )
 
-    # ---------- Helpers ----------
-    @staticmethod
-    def _u32_from_bytes(b1, b2, b3, b4) -> int:
-        return b1 | (b2 << 8) | (b3 << 16) | (b4 << 24)
-
-    def _build_and_send(self, timeout=3) -> int:
-        checksum = 0
-
-        self.cmd_buf[0] = (self.CMD.wPrefix & 0xFF)
-        self.cmd_buf[1] = (self.CMD.wPrefix >> 8) & 0xFF
-        self.cmd_buf[2] = self.CMD.bAddress
-        self.cmd_buf[3] = self.CMD.bCmd
-        self.cmd_buf[4] = self.CMD.bEncode
-        self.cmd_buf[5] = self.CMD.bDataLen & 0xFF
-
-        for i in range(16):
-            self.cmd_buf[6 + i] = self.CMD.bData[i]
+    # ---------- Event-loop integration ----------
+    def fileno(self) -> int:
+        """File descriptor of the sensor UART (for select/selectors)."""
+        return self.ser.fileno()
 
-        for i in range(22):
-            checksum += self.cmd_buf[i]
-
-        self.cmd_buf[22] = checksum & 0xFF
-        self.cmd_buf[23] = (checksum >> 8) & 0xFF
+    def register(self, selector, data="finger") -> None:
+        """
+        Register the sensor UART with a selectors.BaseSelector so a main
+        loop can block on keypad + sensor in one select() call instead of
+        polling each device.
+        """
+        selector.register(self.ser, selectors.EVENT_READ, data)
 
-        self.ser.write(bytes(self.cmd_buf))
+    # ---------- Helpers ----------
+    def _build_and_send(self, timeout=3) -> int:
+        self.CMD.wCheckSum = sum(bytes(self.CMD)[:22]) & 0xFFFF
+        self.ser.write(bytes(self.CMD))
         self.ser.flush()
 
         # Reset CMD for next command
@@ -101,44 +99,31 @@ class FingerVeinSensor:
         return self._recv_packet(timeout=timeout)
 
     def _parse_rsp(self):
-        rsp = self.rsp_raw
-        self.RSP.wPrefix = rsp[0] | (rsp[1] << 8)
-        self.RSP.bAddress = rsp[2]
-        self.RSP.bCmd = rsp[3]
-        self.RSP.bEncode = rsp[4]
-        self.RSP.bDataLen = rsp[5]
-        for i in range(16):
-            self.RSP.bData[i] = rsp[6 + i]
-        self.RSP.wCheckSum = rsp[22] | (rsp[23] << 8)
+        self.RSP = RspPacket.from_buffer_copy(self.rsp_raw)
 
     def _recv_packet(self, timeout=3) -> int:
-        start = time.time()
-
-        while (time.time() - start) < timeout:
-            try:
-                if self.ser.in_waiting >= 24:
-                    raw = self.ser.read(24)
-                    if len(raw) != 24:
-                        continue
-
-                    self.rsp_raw = list(raw)
-
-                    # checksum check
-                    chk = 0
-                    for i in range(22):
-                        chk += self.rsp_raw[i]
-                    chk &= 0xFFFF
-
-                    self._parse_rsp()
+        # Blocking read with a per-call timeout: pyserial waits on the fd in
+        # the kernel until 24 bytes (or the deadline), replacing the old
+        # in_waiting busy-poll that burned CPU for the whole sensor response.
+        old_timeout = self.ser.timeout
+        self.ser.timeout = timeout
+        try:
+            raw = self.ser.read(24)
+        except Exception:
+            return XG_ERR_COM
+        finally:
+            self.ser.timeout = old_timeout
 
-                    if chk == self.RSP.wCheckSum:
-                        return XG_ERR_SUCCESS
-                    return XG_ERR_DATA
+        if len(raw) != 24:
+            return XG_ERR_TIME_OUT
 
-            except Exception:
-                return XG_ERR_COM
+        self.rsp_raw = raw
+        chk = sum(raw[:22]) & 0xFFFF
+        self._parse_rsp()
 
-        return XG_ERR_TIME_OUT
+        if chk == self.RSP.wCheckSum:
+            return XG_ERR_SUCCESS
+        return XG_ERR_DATA
 
     # ---------- Public API ----------
     def connect(self, password="00000000") -> int:
@@ -175,16 +160,9 @@ class FingerVeinSensor:
         self.CMD.bAddress = self.address
         self.CMD.bDataLen = 0x08
 
-        # start_id (u32 LE)
-        self.CMD.bData[0] = start_id & 0xFF
-        self.CMD.bData[1] = (start_id >> 8) & 0xFF
-        self.CMD.bData[2] = (start_id >> 16) & 0xFF
-        self.CMD.bData[3] = (start_id >> 24) & 0xFF
-        # end_id (u32 LE)
-        self.CMD.bData[4] = end_id & 0xFF
-        self.CMD.bData[5] = (end_id >> 8) & 0xFF
-        self.CMD.bData[6] = (end_id >> 16) & 0xFF
-        self.CMD.bData[7] = (end_id >> 24) & 0xFF
+        # start_id / end_id (u32 LE)
+        self.CMD.bData[0:4] = start_id.to_bytes(4, "little")
+        self.CMD.bData[4:8] = end_id.to_bytes(4, "little")
 
         ret = self._build_and_send(timeout=3)
         if ret != XG_ERR_SUCCESS:
@@ -194,7 +172,7 @@ class FingerVeinSensor:
             raise RuntimeError(f"GetEmptyID device error {self.RSP.bData[0]}")
 
         # ID is in bData[1..4]
-        return self._u32_from_bytes(self.RSP.bData[1], self.RSP.bData[2], self.RSP.bData[3], self.RSP.bData[4])
+        return int.from_bytes(bytes(self.RSP.bData[1:5]), "little")
 
     def verify_and_get_id(self, user_id=0) -> int:
         """
@@ -211,10 +189,7 @@ class FingerVeinSensor:
         self.CMD.bAddress = self.address
         self.CMD.bDataLen = 0x04
 
-        self.CMD.bData[0] = user_id & 0xFF
-        self.CMD.bData[1] = (user_id >> 8) & 0xFF
-        self.CMD.bData[2] = (user_id >> 16) & 0xFF  # fixed
-        self.CMD.bData[3] = (user_id >> 24) & 0xFF
+        self.CMD.bData[0:4] = (user_id & 0xFFFFFFFF).to_bytes(4, "little")
 
         ret = self._build_and_send(timeout=time_out)
 
@@ -223,7 +198,7 @@ class FingerVeinSensor:
                 status = self.RSP.bData[0]
 
                 if status == XG_ERR_SUCCESS:
-                    return self._u32_from_bytes(self.RSP.bData[1], self.RSP.bData[2], self.RSP.bData[3], self.RSP.bData[4])
+                    return int.from_bytes(bytes(self.RSP.bData[1:5]), "little")
 
                 if status == XG_INPUT_FINGER:
                     # Keep waiting for next packet
@@ -248,10 +223,7 @@ class FingerVeinSensor:
         self.CMD.bAddress = self.address
         self.CMD.bDataLen = 0x06
 
-        self.CMD.bData[0] = user_id & 0xFF
-        self.CMD.bData[1] = (user_id >> 8) & 0xFF
-        self.CMD.bData[2] = (user_id >> 16) & 0xFF
-        self.CMD.bData[3] = (user_id >> 24) & 0xFF
+        self.CMD.bData[0:4] = (user_id & 0xFFFFFFFF).to_bytes(4, "little")
         self.CMD.bData[4] = group_id
         self.CMD.bData[5] = temp_num
 
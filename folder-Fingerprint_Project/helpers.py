@@ -0,0 +1,104 @@
+"""
+Shared small helpers for the check-in apps.
+
+main.py and Main_main.py each carried near-identical copies of the JSON
+load/save and display-string helpers -- two sets of code objects to
+compile and keep in RAM, and two places to apply any fix. This module
+is the single implementation both import.
+"""
+
+import os
+import re
+import time
+import functools
+try:
+    import orjson as _json          # C parser/serializer when available
+except ImportError:
+    _json = None
+    import json
+from pathlib import Path
+
+# Keypad digit keys arrive as single characters; a frozenset membership
+# test beats str()+isdigit() per keypress.
+_DIGITS = frozenset("0123456789")
+
+
+def load_json(path: Path) -> dict:
+    try:
+        raw = path.read_bytes()
+    except FileNotFoundError:
+        return {}
+    return _json.loads(raw) if _json is not None else json.loads(raw)
+
+
+def save_json(path: Path, data: dict) -> None:
+    # Write tmp + rename so a crash mid-write never leaves a truncated
+    # file behind. Compact encoding, written as bytes: these files are
+    # machine-read state, and the smaller write halves what has to hit
+    # the SD card on every status flush.
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    if _json is not None:
+        tmp.write_bytes(_json.dumps(data))
+    else:
+        tmp.write_bytes(json.dumps(data, separators=(",", ":")).encode("utf-8"))
+    os.replace(tmp, path)
+
+
+# Employee names repeat, so the strip/truncate result is memoized; every
+# redraw after the first scan for a given name is a cache hit.
+@functools.lru_cache(maxsize=256)
+def _short(s: str, max_len: int = 21) -> str:
+    s = (s or "").strip()
+    return s if len(s) <= max_len else (s[: max_len - 1] + ".")
+
+
+# Today's date string, rebuilt only when the day rolls over.
+_TODAY_CACHE = {"yday": -1, "text": ""}
+
+
+def _today() -> str:
+    now = time.localtime()
+    if now.tm_yday != _TODAY_CACHE["yday"]:
+        _TODAY_CACHE["yday"] = now.tm_yday
+        _TODAY_CACHE["text"] = f"{now.tm_year:04d}-{now.tm_mon:02d}-{now.tm_mday:02d}"
+    return _TODAY_CACHE["text"]
+
+
+# HH:MM only changes once a minute, so the formatted string is cached
+# against the integer minute counter.
+_HHMM_CACHE = {"min": -1, "text": ""}
+
+
+def _hhmm() -> str:
+    minute = int(time.time() // 60)
+    if minute != _HHMM_CACHE["min"]:
+        now = time.localtime()
+        _HHMM_CACHE["min"] = minute
+        _HHMM_CACHE["text"] = f"{now.tm_hour:02d}:{now.tm_min:02d}"
+    return _HHMM_CACHE["text"]
+
+
+# Idle frames sort by their number, not lexically, so frame_10.png
+# plays after frame_9.png even when the names are not zero-padded.
+_FRAME_NUM = re.compile(r"frame_(\d+)\.png$")
+
+
+def _frame_sort_key(path: Path):
+    m = _FRAME_NUM.search(path.name)
+    return (int(m.group(1)), path.name) if m else (1 << 30, path.name)
+
+
+def _pin_to_core(core: int) -> None:
+    """Best-effort CPU affinity pin for worker threads.
+
+    On multicore Pis this keeps each hot producer/consumer pair on a
+    stable core cache; it is a no-op on single-core boards, when the
+    requested core is unavailable, or on kernels without affinity
+    support.
+    """
+    try:
+        cpus = os.sched_getaffinity(0)
+        if core in cpus and len(cpus) > 1:
+            os.sched_setaffinity(0, {core})
+    except (AttributeError, OSError):
+        pass
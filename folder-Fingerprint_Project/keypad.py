@@ -1,15 +1,24 @@
 #==========================
 # Imports
 # =========================
+import os
 import serial
-from luma.core.interface.serial import i2c
-from luma.oled.device import ssd1306,ssd1309  # change if you use sh1106 etc.
-from PIL import Image, ImageDraw, ImageFont
+import selectors
 
-import time             
-import csv
-from datetime import datetime
-from pathlib import Path
+
+# Byte -> event lookup table, built once: decoding is a single indexed
+# get per byte instead of walking an if/elif chain.
+_KEY_TABLE = [None] * 256
+for _b in (10, 13):                 # LF or CR
+    _KEY_TABLE[_b] = ("enter", None)
+for _b in (8, 127):                 # backspace
+    _KEY_TABLE[_b] = ("back", None)
+for _b in (0, 1):
+    _KEY_TABLE[_b] = ("Home", None)
+_KEY_TABLE[2] = ("PgUp", None)
+_KEY_TABLE[3] = ("PgDn", None)
+for _c in "0123456789*#":
+    _KEY_TABLE[ord(_c)] = ("key", _c)
 
 
 # =========================
@@ -24,38 +33,57 @@ class KeypadUART:
     def __init__(self, port, baud):
         self.ser = serial.Serial(port, baudrate=baud, timeout=0)
         self.buffer = bytearray()
+        # Ask the USB-serial bridge to hand bytes over immediately instead
+        # of holding them for its default 16 ms latency timer.
+        try:
+            self.ser.set_low_latency_mode(True)
+        except (AttributeError, ValueError, OSError):
+            pass
+        try:
+            with open(f"/sys/bus/usb-serial/devices/{os.path.basename(port)}/latency_timer", "w") as f:
+                f.write("1")
+        except OSError:
+            pass
+        # Lets callers sleep in the kernel until a byte arrives instead of
+        # spinning on poll() + time.sleep().
+        self._sel = selectors.DefaultSelector()
+        self._sel.register(self.ser, selectors.EVENT_READ)
+
+    def fileno(self) -> int:
+        """File descriptor of the keypad UART, for external select loops."""
+        return self.ser.fileno()
 
     def decode_bytes_to_keys(self, data: bytes):
         # ---- YOU WILL EDIT THIS ----
-        # Generic fallback: assume keypad sends ASCII characters directly.
-        # e.g. b'1', b'2', b'3', b'\n'
-        events = []
-        for b in data:
-            if b in (10, 13):              # LF or CR
-                events.append(("enter", None))
-            elif b in (8, 127):            # backspace
-                events.append(("back", None))
-            elif b in (0,1):
-                events.append(("Home", None))
-            elif b == 2 :
-                events.append(("PgUp", None))
-            elif b == 3 :
-                events.append(("PgDn", None))
-            else:
-                ch = chr(b)
-                # accept digits and asterisk/hash as typical keypad keys
-                if ch.isdigit() or ch in ("*", "#"):
-                    events.append(("key", ch))
-        return events
+        # Generic fallback: assume keypad sends ASCII characters directly
+        # (e.g. b'1', b'\n'); unknown bytes map to None and are dropped.
+        return [e for b in data if (e := _KEY_TABLE[b]) is not None]
 
     def poll(self):
-        events = []
+        # Drain everything waiting in one pass so a burst of fast typing
+        # decodes as a single batch instead of one event per caller tick.
         n = self.ser.in_waiting
-        if n > 0:
-            data = self.ser.read(n)
-            events.extend(self.decode_bytes_to_keys(data))
-        return events
-
+        if not n:
+            return []
+        data = bytearray()
+        while n:
+            data += self.ser.read(n)
+            n = self.ser.in_waiting
+        return self.decode_bytes_to_keys(bytes(data))
+
+    def wait_events(self, timeout=None):
+        """
+        Block until keypad bytes arrive (or timeout seconds pass), then
+        return the decoded events. Returns [] on timeout. Unlike poll(),
+        the wait happens in the kernel (select/epoll), so idle CPU is zero
+        and wake latency is sub-ms instead of the polling interval.
+        """
+        events = self.poll()
+        if events:
+            return events
+        if not self._sel.select(timeout):
+            return []
+        return self.poll()
 
     def collect_code_from_keypad(keypad, oled, max_len=5):
         """
@@ -67,7 +95,7 @@ class KeypadUART:
         oled.show_lines(["ENTER CODE:", "", "Press Enter", "Back = delete"])
 
         while True:
-            for event, value in keypad.poll():
+            for event, value in keypad.wait_events(0.5):
 
                 if event == "key":
                     if len(code) < max_len:
@@ -83,56 +111,23 @@ class KeypadUART:
                 shown = code
                 oled.show_lines(["ENTER CODE:", shown, "Press Enter", "Back = delete"])
 
-            time.sleep(0.05)
+    # Event -> frame for show_touched_key; "key" is the only dynamic one.
+    _TOUCH_FRAMES = {
+        "enter": ["KEY PRESSED:", "ENTER", "", ""],
+        "back": ["KEY PRESSED:", "BACK", "", ""],
+        "PgUp": ["KEY PRESSED:", "PGUP", "", ""],
+        "PgDn": ["KEY PRESSED:", "PGDN", "", ""],
+        "Home": ["KEY PRESSED:", "HOME", "", ""],
+        "Menu": ["KEY PRESSED:", "MENU", "", ""],
+    }
 
     def show_touched_key(oled, event, value):
         """
         Display the last touched key on the OLED.
         """
         if event == "key":
-            oled.show_lines([
-                "KEY PRESSED:",
-                value,
-                "",
-                ""
-            ])
-
-        elif event == "enter":
-            oled.show_lines([
-                "KEY PRESSED:",
-                "ENTER",
-                "",
-                ""
-            ])
-
-        elif event == "back":
-            oled.show_lines([
-                "KEY PRESSED:",
-                "BACK",
-                "",
-                ""
-            ])
-        
-        elif event == "PgUp":
-            oled.show_lines([
-                "KEY PRESSED:",
-                "BACK",
-                "",
-                ""
-            ])
-        
-        elif event == "PgUp":
-            oled.show_lines([
-                "KEY PRESSED:",
-                "PGUP",
-                "",
-                ""
-            ])
-        
-        elif event == "Menu":
-            oled.show_lines([
-                "KEY PRESSED:",
-                "MENU",
-                "",
-                ""
-            ])
+            lines = ["KEY PRESSED:", value, "", ""]
+        else:
+            lines = KeypadUART._TOUCH_FRAMES.get(event)
+        if lines:
+            oled.show_lines(lines)
@@ -1,16 +1,20 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import os
 import time
 import csv
-import json
+import pickle
+import atexit
+import selectors
 import threading
 import queue
+from collections import deque
 from pathlib import Path
-from datetime import datetime
 
-from PIL import Image  # <-- needed for idle frames
-from oled import OLED
+from PIL import Image, ImageDraw  # <-- needed for idle frames
+from helpers import load_json, save_json, _short, _today, _hhmm, _pin_to_core, _DIGITS, _frame_sort_key
+from oled import OLED, pack_frame
 from keypad import KeypadUART
 from fingerprint_sensor import FingerVeinSensor
 
@@ -26,8 +30,8 @@ USER_NAME_COL = "Employee Name"
 USER_CODE_COL = "Code"
 
 ATTENDANCE_LOG = Path("attendance_log.csv")
+CODEMAP_CACHE = Path("code_to_name.pickle")  # fast-start snapshot of the CSV map
 CURRENT_STATUS = Path("current_status.json")  # NEW: Track who's IN/OUT
-SENSOR_LOCK = threading.Lock()
 
 # Mapping files
 MAP_FILE = Path("finger_code_map.json")             # finger_id(str) -> user_code(str)
@@ -71,39 +75,54 @@ class IdleAnimator:
         self.enabled = False
         self._frames = []
         self._idx = 0
-        self._last_ts = 0.0
+        # Integer-ns deadline arithmetic: no float division or modulo on
+        # the per-tick path.
+        self._interval_ns = int(1e9 / self.fps) if self.fps > 0 else 0
+        self._last_ts_ns = 0
 
         self.reload()
 
     def reload(self):
-        self._frames = sorted(self.frames_dir.glob("frame_*.png"))
-        if not self._frames:
+        paths = sorted(self.frames_dir.glob("frame_*.png"), key=_frame_sort_key)
+        if not paths:
             raise FileNotFoundError(
                 f"No frames found in {self.frames_dir}. Expected frame_001.png etc."
             )
+        # Decode + convert every PNG once up front; tick() then indexes
+        # ready-to-display images instead of re-reading the SD card and
+        # re-dithering at IDLE_FPS forever.
+        self._frames = [Image.open(p).convert("1").copy() for p in paths]
+        # Packed page-order buffers for the raw single-burst I2C path;
+        # tick() then pushes ready bytes with no PIL work at all.
+        self._raw = [pack_frame(f) for f in self._frames] if self.oled.raw_ok else None
         self._idx = 0
-        self._last_ts = 0.0
+        self._last_ts_ns = 0
 
     def enable(self, reset=True):
         self.enabled = True
         if reset:
             self._idx = 0
-            self._last_ts = 0.0
+            self._last_ts_ns = 0
 
     def disable(self):
         self.enabled = False
 
     def set_fps(self, fps):
         self.fps = float(fps)
+        self._interval_ns = int(1e9 / self.fps) if self.fps > 0 else 0
 
     def set_step(self, step):
         self.step = max(1, int(step))
 
-    def _safe_display(self, img: Image.Image) -> bool:
-        img = img.convert("1")
+    def _safe_display(self, idx: int) -> bool:
+        # Raw path pushes a pre-packed buffer in one I2C burst; fallback
+        # displays the preloaded mode-1 frame through luma.
         for _ in range(self.retries):
             try:
-                self.oled.device.display(img)
+                if self._raw is not None:
+                    self.oled.blit_raw(self._raw[idx])
+                else:
+                    self.oled.device.display(self._frames[idx])
                 return True
             except OSError:
                 time.sleep(self.retry_delay)
@@ -113,33 +132,23 @@ class IdleAnimator:
         if not self.enabled:
             return False
 
-        now = time.time()
-        interval = 1.0 / self.fps if self.fps > 0 else 0.0
-        if (now - self._last_ts) < interval:
+        now = time.monotonic_ns()
+        if (now - self._last_ts_ns) < self._interval_ns:
             return False
 
-        fp = self._frames[self._idx]
-        img = Image.open(fp)
-
-        ok = self._safe_display(img)
-        self._last_ts = now
+        ok = self._safe_display(self._idx)
+        self._last_ts_ns = now
 
         # Advance by step (this controls speed a lot)
-        self._idx = (self._idx + self.step) % len(self._frames)
+        self._idx += self.step
+        if self._idx >= len(self._frames):
+            self._idx -= len(self._frames)
         return ok
 
 
 # =========================
 # Helpers
 # =========================
-def load_json(path: Path) -> dict:
-    if path.exists():
-        return json.loads(path.read_text())
-    return {}
-
-def save_json(path: Path, data: dict) -> None:
-    path.write_text(json.dumps(data, indent=2))
-
 def load_users_from_csv(csv_path: Path) -> list[dict]:
     if not csv_path.exists():
         raise FileNotFoundError(f"User list CSV not found: {csv_path}")
@@ -151,113 +160,172 @@ def load_users_from_csv(csv_path: Path) -> list[dict]:
     return users
 
 def load_code_to_name(csv_path: Path) -> dict:
-    users = load_users_from_csv(csv_path)
-    out = {}
-    for row in users:
-        code = (row.get(USER_CODE_COL) or "").strip()
-        name = (row.get(USER_NAME_COL) or "").strip()
-        if code:
-            out[code] = name or "UNKNOWN"
+    # csv.reader + integer column indices resolved once from the header:
+    # no per-row dict allocation or header-string hashing like DictReader.
+    if not csv_path.exists():
+        raise FileNotFoundError(f"User list CSV not found: {csv_path}")
+    with csv_path.open("r", newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            raise ValueError("CSV is empty.")
+        ci = header.index(USER_CODE_COL)
+        ni = header.index(USER_NAME_COL)
+        out = {}
+        for row in reader:
+            code = row[ci].strip() if len(row) > ci else ""
+            if code:
+                name = row[ni].strip() if len(row) > ni else ""
+                out[code] = name or "UNKNOWN"
     return out
 
-def log_attendance(employee_name: str, code: str, method: str, action: str) -> None:  # CHANGED: result -> action
-    """Log attendance with IN/OUT action."""
+# Attendance rows are queued and written by a daemon thread that keeps
+# the file open, so the check-in path never waits on open/write/close.
+_LOG_Q = queue.SimpleQueue()
+_log_thread = None
+
+def _log_worker():
     ATTENDANCE_LOG.parent.mkdir(parents=True, exist_ok=True)
     new_file = not ATTENDANCE_LOG.exists()
-    now = datetime.now()
     with ATTENDANCE_LOG.open("a", newline="", encoding="utf-8") as f:
         w = csv.writer(f)
         if new_file:
-            w.writerow(["date", "time", "employee_name", "code", "method", "action"])  # CHANGED
-        w.writerow([now.strftime("%Y-%m-%d"), now.strftime("%H:%M:%S"),
-                    employee_name, code, method, action])  # CHANGED
-
-def _short(s: str, max_len: int = 21) -> str:
-    s = (s or "").strip()
-    return s if len(s) <= max_len else (s[: max_len - 1] + ".")
+            w.writerow(["date", "time", "employee_name", "code", "method", "action"])
+            f.flush()
+        while True:
+            row = _LOG_Q.get()
+            if row is None:                 # shutdown sentinel from atexit
+                f.flush()
+                return
+            w.writerow(row)
+            if _LOG_Q.empty():
+                f.flush()
+
+def _drain_log_queue():
+    _LOG_Q.put(None)
+    if _log_thread is not None:
+        _log_thread.join(timeout=2)
+
+def log_attendance(employee_name: str, code: str, method: str, action: str) -> None:
+    """Queue one attendance row; the writer thread owns the CSV."""
+    global _log_thread
+    if _log_thread is None:
+        _log_thread = threading.Thread(target=_log_worker, daemon=True)
+        _log_thread.start()
+        atexit.register(_drain_log_queue)
+    now = time.localtime()
+    _LOG_Q.put([_today(), f"{now.tm_hour:02d}:{now.tm_min:02d}:{now.tm_sec:02d}",
+                employee_name, code, method, action])
+
+# Parsed-file caches keyed on mtime: finger_lookup runs on every scan,
+# so a single stat() replaces the CSV/JSON re-parse when nothing changed.
+# None = never loaded; a missing file stats as 0.0, and the two must not
+# compare equal or a CSV absent at boot would silently cache as empty.
+_CODE_TO_NAME_CACHE = {"mtime": None, "data": {}}
+_FINGER_MAP_CACHE = {"mtime": None, "data": {}}
+
+def _file_mtime(path: Path) -> float:
+    try:
+        return path.stat().st_mtime
+    except OSError:
+        return 0.0
+
+def get_code_to_name() -> dict:
+    mtime = _file_mtime(USERS_CSV)
+    if mtime != _CODE_TO_NAME_CACHE["mtime"]:
+        # A pickled snapshot loads far faster than a CSV parse on SD-card
+        # cold starts; it is rebuilt whenever the CSV is newer than it.
+        if _file_mtime(CODEMAP_CACHE) >= mtime > 0:
+            try:
+                with CODEMAP_CACHE.open("rb") as f:
+                    _CODE_TO_NAME_CACHE["data"] = pickle.load(f)
+                _CODE_TO_NAME_CACHE["mtime"] = mtime
+                return _CODE_TO_NAME_CACHE["data"]
+            except (OSError, pickle.UnpicklingError, EOFError):
+                pass                        # stale/corrupt snapshot: reparse
+        data = load_code_to_name(USERS_CSV)
+        _CODE_TO_NAME_CACHE["data"] = data
+        _CODE_TO_NAME_CACHE["mtime"] = mtime
+        try:
+            tmp = CODEMAP_CACHE.with_suffix(".tmp")
+            with tmp.open("wb") as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, CODEMAP_CACHE)
+        except OSError:
+            pass                            # snapshot is best-effort
+    return _CODE_TO_NAME_CACHE["data"]
+
+def get_finger_map() -> dict:
+    mtime = _file_mtime(MAP_FILE)
+    if mtime != _FINGER_MAP_CACHE["mtime"]:
+        _FINGER_MAP_CACHE["data"] = load_json(MAP_FILE)
+        _FINGER_MAP_CACHE["mtime"] = mtime
+    return _FINGER_MAP_CACHE["data"]
 
 def finger_lookup(finger_id: int) -> tuple:
-    """Check if finger ID is mapped to a user code."""
-    finger_code_map = load_json(MAP_FILE)  # finger_id -> user_code
-    code = finger_code_map.get(str(finger_id))
+    """Check if finger ID is mapped to a user code, using cached maps."""
+    code = get_finger_map().get(str(finger_id))
     if not code:
         return (False, None, None)
-    name = load_code_to_name(USERS_CSV).get(code, "UNKNOWN")
-    return (True, code, name)
-
-# =========================
-# NEW: IN/OUT Status Functions
-# =========================
-def get_user_status(user_code: str) -> str:
-    """Get current IN/OUT status for a user."""
-    status_data = load_json(CURRENT_STATUS)
-    
-    # Check if we need daily reset
-    today = datetime.now().strftime("%Y-%m-%d")
-    if "last_reset" not in status_data or status_data["last_reset"] != today:
-        # New day, reset all statuses to OUT
-        status_data = {"last_reset": today}
-        save_json(CURRENT_STATUS, status_data)
-        return "OUT"  # Everyone starts as OUT
-    
-    # Return current status or default to OUT
-    return status_data.get(user_code, "OUT")
-
-def update_user_status(user_code: str, action: str):
-    """Update user's current status."""
-    status_data = load_json(CURRENT_STATUS)
-    
-    # Ensure we have today's date
-    today = datetime.now().strftime("%Y-%m-%d")
-    if "last_reset" not in status_data or status_data["last_reset"] != today:
-        # New day, reset
-        status_data = {"last_reset": today}
-    
-    # Update status
-    status_data[user_code] = action
-    save_json(CURRENT_STATUS, status_data)
-
+    return (True, code, get_code_to_name().get(code, "UNKNOWN"))
 
 # =========================
 # Finger scan background thread
 # =========================
 
 class FingerWorker(threading.Thread):
-    def __init__(self, sensor: FingerVeinSensor, out_q: queue.Queue, lock: threading.Lock):
+    # out_q is a deque(maxlen=1): single producer, single consumer, only
+    # the newest event matters, so append/popleft need no Queue locking.
+    def __init__(self, sensor: FingerVeinSensor, out_q: deque,
+                 event: threading.Event, wake_fd=None):
         super().__init__(daemon=True)
         self.sensor = sensor
         self.out_q = out_q
-        self.lock = lock
+        self.event = event
+        self.wake_fd = wake_fd      # pipe write end; one byte per event
         self._stop = threading.Event()
         self.last_reported_fid = -1  # Track last finger ID
         self.last_detection_time = 0  # Track last detection time
+        self._err_sleep = 0.2        # doubles on repeated I/O faults, resets on success
 
     def stop(self):
         self._stop.set()
 
     def run(self):
+        # The sensor is confined to this thread: shutdown() joins the
+        # worker before touching the sensor, so no lock is needed and
+        # verify_and_get_id's own serial timeout paces the polling.
+        _pin_to_core(1)     # keep the finger mailbox on a stable cache
         while not self._stop.is_set():
-            got = self.lock.acquire(timeout=0.2)
-            if not got:
-                continue
             try:
                 fid = self.sensor.verify_and_get_id(user_id=0)  # may block
+                self._err_sleep = 0.2
                 if fid >= 0:  # Only process valid finger IDs
-                    now = time.time()
+                    now = time.monotonic()
                     # Only report if:
                     # 1. Different finger, OR
                     # 2. Same finger but > 2 seconds since last detection
                     if fid != self.last_reported_fid or (now - self.last_detection_time) > 2.0:
                         self.last_reported_fid = fid
                         self.last_detection_time = now
-                        self.out_q.put(("finger_ok", fid))
+                        self.out_q.append(("finger_ok", fid))
+                        self.event.set()
+                        if self.wake_fd is not None:
+                            try:
+                                os.write(self.wake_fd, b"\x01")
+                            except OSError:
+                                pass
+            except OSError as e:
+                # Serial fault (cable pulled, port gone): back off
+                # exponentially instead of retrying every 200 ms forever,
+                # and report only the first error of a burst.
+                if self._err_sleep == 0.2:
+                    print(f"Finger sensor I/O error: {e}")
+                time.sleep(self._err_sleep)
+                self._err_sleep = min(self._err_sleep * 2, 5.0)
             except Exception:
+                # No-match / protocol errors: brief pause, then rescan
                 time.sleep(0.2)
-            finally:
-                try:
-                    self.lock.release()
-                except RuntimeError:
-                    pass
 
 
 # =========================
@@ -265,6 +333,10 @@ class FingerWorker(threading.Thread):
 # =========================
 class App:
     def __init__(self):
+        # Pre-set so shutdown() stays deterministic if construction
+        # fails partway; None checks replace per-call hasattr probes.
+        self.fw = self.sensor = None
+        self._sensor_close = None
         self.oled = OLED()
         self.keypad = KeypadUART(KEYPAD_PORT, KEYPAD_BAUD)
 
@@ -279,6 +351,8 @@ class App:
 
         # Initialize sensor
         self.sensor = FingerVeinSensor(baud_index=3)
+        # Manufacturer close hook, resolved once (None on this wrapper)
+        self._sensor_close = getattr(self.sensor, "CloseConnectDev", None)
         ret = self.sensor.connect(SENSOR_PASSWORD)
         
         if ret != 0:
@@ -291,28 +365,51 @@ class App:
                 pass
             raise RuntimeError(f"Sensor connect failed with code: {ret}")
 
-        self.code_to_name = load_code_to_name(USERS_CSV)
+        self.code_to_name = get_code_to_name()
 
         self.state = "IDLE"
-        self.buf = ""
-        self.last_ts = time.time()
+        self.buf = bytearray()
+        self.last_ts = time.monotonic()
+        self.result_expires_at = 0.0
+        self._welcome_cache = {}   # (name, code, action) -> pre-rendered frame
+        self._idle_active = False  # tracks animator state to skip redundant toggles
         
         # Finger debouncing variables
         self.last_finger_time = 0
         self.finger_cooldown = FINGER_COOLDOWN
 
-        self.fq = queue.Queue()
-        self.fw = FingerWorker(self.sensor, self.fq, SENSOR_LOCK)
+        # Single-slot mailbox: newest finger event wins, flagged by an Event.
+        # The pipe lets the worker wake the select() below immediately.
+        self.fq = deque(maxlen=1)
+        self.fq_event = threading.Event()
+        self._finger_r, self._finger_w = os.pipe()
+        os.set_blocking(self._finger_r, False)
+        self.fw = FingerWorker(self.sensor, self.fq, self.fq_event,
+                               wake_fd=self._finger_w)
         self.fw.start()
 
+        # One kernel wait covers both input sources
+        self._sel = selectors.DefaultSelector()
+        self._sel.register(self.keypad.ser, selectors.EVENT_READ, data="keypad")
+        self._sel.register(self._finger_r, selectors.EVENT_READ, data="finger")
+
         # Initialize current status for today
         self._init_daily_status()
-        
+
+        # In-memory IN/OUT state with a write-behind thread: the check-in
+        # path only touches the dict; disk sees an atomic rewrite shortly
+        # after, off the hot path.
+        self.status = load_json(CURRENT_STATUS)
+        self._reset_day = self.status.get("last_reset")
+        self._status_lock = threading.Lock()
+        self._status_dirty = threading.Event()
+        threading.Thread(target=self._status_writer, daemon=True).start()
+
         self.enter_idle()
 
     def _init_daily_status(self):
         """Initialize or reset daily status file."""
-        today = datetime.now().strftime("%Y-%m-%d")
+        today = _today()
         status_data = load_json(CURRENT_STATUS)
         if "last_reset" not in status_data or status_data["last_reset"] != today:
             # New day, reset all statuses
@@ -323,9 +420,18 @@ class App:
     def shutdown(self):
         """Clean shutdown of all components."""
         print("\nShutting down system...")
+
+        # Flush any status change the write-behind thread hasn't gotten to
+        if self._status_dirty.is_set():
+            self._status_dirty.clear()
+            with self._status_lock:
+                try:
+                    save_json(CURRENT_STATUS, self.status)
+                except OSError as e:
+                    print(f"Status write failed: {e}")
         
         # Stop finger worker thread first
-        if hasattr(self, 'fw') and self.fw:
+        if self.fw is not None:
             try:
                 print("Stopping finger worker thread...")
                 self.fw.stop()
@@ -335,14 +441,14 @@ class App:
                 print(f"Error stopping finger worker: {e}")
         
         # Proper sensor shutdown
-        if hasattr(self, 'sensor') and self.sensor:
+        if self.sensor is not None:
             try:
                 print("Shutting down sensor...")
                 
-                # Try manufacturer's CloseConnectDev first
-                if hasattr(self.sensor, 'CloseConnectDev'):
+                # Manufacturer's CloseConnectDev, when the wrapper has one
+                if self._sensor_close is not None:
                     print("Using CloseConnectDev...")
-                    ret = self.sensor.CloseConnectDev(3000)
+                    ret = self._sensor_close(3000)
                     print(f"CloseConnectDev returned: {ret}")
                 else:
                     # Use regular shutdown
@@ -352,44 +458,101 @@ class App:
             except Exception as e:
                 print(f"Error during sensor shutdown: {e}")
         
+        # Close the finger wake pipe
+        try:
+            os.close(self._finger_r)
+            os.close(self._finger_w)
+        except OSError:
+            pass
+
         # Clear OLED
         try:
             self.oled.clear()
             print("OLED cleared")
         except:
             pass
-        
+
         print("System shutdown complete")
 
+    # ----- IN/OUT status (in-memory, write-behind) -----
+    def get_user_status(self, user_code: str) -> str:
+        """Get current IN/OUT status for a user."""
+        # _reset_day short-circuits the rollover check: in steady state
+        # this is a string compare and one dict get, no I/O.
+        today = _today()
+        if self._reset_day != today:
+            with self._status_lock:
+                # New day: everyone starts as OUT
+                self.status = {"last_reset": today}
+                self._reset_day = today
+                self._status_dirty.set()
+            return "OUT"
+        with self._status_lock:
+            return self.status.get(user_code, "OUT")
+
+    def update_user_status(self, user_code: str, action: str):
+        """Update user's current status."""
+        today = _today()
+        with self._status_lock:
+            if self._reset_day != today:
+                self.status = {"last_reset": today}
+                self._reset_day = today
+            self.status[user_code] = action
+            self._status_dirty.set()
+
+    def _status_writer(self):
+        # The whole serialize + tmp + os.replace runs under the lock:
+        # shutdown()'s flush uses the same tmp file, and two concurrent
+        # writers could install each other's half-written output.
+        while True:
+            self._status_dirty.wait()
+            self._status_dirty.clear()
+            with self._status_lock:
+                try:
+                    save_json(CURRENT_STATUS, self.status)
+                except OSError as e:
+                    print(f"Status write failed: {e}")
+
     def clear_finger_queue(self):
-        """Clear all pending finger events from the queue."""
-        try:
-            while True:
-                self.fq.get_nowait()
-        except queue.Empty:
-            pass
+        """Clear any pending finger event from the mailbox."""
+        self.fq.clear()
+        self.fq_event.clear()
 
     # ----- Idle control -----
     def enter_idle(self):
         self.state = "IDLE"
-        self.buf = ""
-        self.idle.enable(reset=False)  # keep animation position
+        self.buf = bytearray()
+        if not self._idle_active:       # no-op on back-to-back returns to idle
+            self.idle.enable(reset=False)  # keep animation position
+            self._idle_active = True
         # Do NOT call show_lines here; the animator owns the OLED during idle
 
     def exit_idle(self):
-        self.idle.disable()
+        if self._idle_active:
+            self.idle.disable()
+            self._idle_active = False
+
+    def _show_result(self, duration: float):
+        """Hold the current screen without blocking the main loop.
+
+        Replaces the time.sleep() tails in the handlers: the loop keeps
+        polling the keypad and sensor while the result screen is up, and
+        enter_idle() fires when the deadline passes.
+        """
+        self.state = "SHOW_RESULT"
+        self.result_expires_at = time.monotonic() + duration
 
     # ----- UI screens (disable idle first so it doesn't overwrite) -----
     def show_buf(self):
         self.exit_idle()
-        self.oled.show_lines(["ENTER CODE:", self.buf, "ENTER=submit", "BACK=delete"])
+        self.oled.show_lines(["ENTER CODE:", self.buf.decode(), "ENTER=submit", "BACK=delete"])
 
     # =========================
     # UPDATED: Handle Finger with IN/OUT logic and debouncing
     # =========================
     def handle_finger(self, finger_id: int):
         # Debounce check
-        now = time.time()
+        now = time.monotonic()
         if (now - self.last_finger_time) < self.finger_cooldown:
             # Clear any queued events during cooldown
             self.clear_finger_queue()
@@ -402,86 +565,81 @@ class App:
         
         if not enrolled:
             self.oled.show_lines(["UNKNOWN FINGER", "NOT ENROLLED", "", ""])
-            time.sleep(1.5)
-            self.enter_idle()
+            self._show_result(1.5)
             return
 
         # Clear any queued events after successful detection
         self.clear_finger_queue()
         
         # Determine IN/OUT action
-        current_status = get_user_status(code)
+        current_status = self.get_user_status(code)
         action = "OUT" if current_status == "IN" else "IN"
         
         # Log attendance
         log_attendance(name, code, "finger", action)
-        update_user_status(code, action)
+        self.update_user_status(code, action)
         
-        # Show appropriate message
-        t_now = datetime.now().strftime("%H:%M")
-        if action == "IN":
-            self.oled.show_lines([
-                f"WELCOME {_short(name)}!",
-                f"Code: {code}",
-                f"Time: {t_now}",
-                "Status: IN ?"
-            ])
-        else:
-            self.oled.show_lines([
-                f"GOODBYE {_short(name)}!",
-                f"Code: {code}",
-                f"Time: {t_now}",
-                "Have a nice day!"
-            ])
+        # Show appropriate message (static part cached per employee)
+        self._show_result_screen(name, code, action)
         
-        time.sleep(3)
-        self.enter_idle()
+        self._show_result(3.0)
 
     # =========================
     # UPDATED: Handle Code with IN/OUT logic
     # =========================
     def handle_code_submit(self):
         # Update last finger time for code entries too (to prevent immediate finger scan after code)
-        self.last_finger_time = time.time()
+        self.last_finger_time = time.monotonic()
         self.exit_idle()
         
-        code = self.buf
+        code = self.buf.decode()
         name = self.code_to_name.get(code)
         
         if not name:
             log_attendance("UNKNOWN", code, "code", "DENIED")
             self.oled.show_lines(["DENIED", "Invalid code", "", ""])
-            time.sleep(1.5)
-            self.enter_idle()
+            self._show_result(1.5)
             return
 
         # Determine IN/OUT action
-        current_status = get_user_status(code)
+        current_status = self.get_user_status(code)
         action = "OUT" if current_status == "IN" else "IN"
         
         # Log attendance
         log_attendance(name, code, "code", action)
-        update_user_status(code, action)
+        self.update_user_status(code, action)
         
-        # Show appropriate message
-        t_now = datetime.now().strftime("%H:%M")
-        if action == "IN":
-            self.oled.show_lines([
-                f"WELCOME {_short(name)}!",
-                f"Code: {code}",
-                f"Time: {t_now}",
-                "Status: IN ?"
-            ])
-        else:
-            self.oled.show_lines([
-                f"GOODBYE {_short(name)}!",
-                f"Code: {code}",
-                f"Time: {t_now}",
-                "Have a nice day!"
-            ])
+        # Show appropriate message (static part cached per employee)
+        self._show_result_screen(name, code, action)
         
-        time.sleep(3)
-        self.enter_idle()
+        self._show_result(3.0)
+
+    def _show_result_screen(self, name: str, code: str, action: str):
+        """Display the WELCOME/GOODBYE screen from a per-employee cache.
+
+        The static lines are rasterized once per (name, code, action);
+        repeat scans only draw the time field onto a copy, so font
+        layout leaves the hot path after an employee's first scan.
+        """
+        key = (name, code, action)
+        base = self._welcome_cache.get(key)
+        if base is None:
+            base = Image.new("1", self.oled.device.size, 0)
+            draw = ImageDraw.Draw(base)
+            if action == "IN":
+                lines = (f"WELCOME {_short(name)}!", f"Code: {code}", "", "Status: IN ?")
+            else:
+                lines = (f"GOODBYE {_short(name)}!", f"Code: {code}", "", "Have a nice day!")
+            y = 0
+            for line in lines:
+                draw.text((0, y), line, font=self.oled.font, fill=1)
+                y += 12
+            self._welcome_cache[key] = base
+        img = base.copy()
+        ImageDraw.Draw(img).text((0, 24), f"Time: {_hhmm()}", font=self.oled.font, fill=1)
+        with self.oled._render_lock:
+            self.oled.device.display(img)
+            self.oled._last_lines = None    # cached frames bypass the show_lines dedupe
 
     def run(self):
         # Show welcome message
@@ -495,26 +653,33 @@ class App:
             if self.state == "IDLE":
                 self.idle.tick()
 
+            # ---- result screen expiry (non-blocking hold) ----
+            if self.state == "SHOW_RESULT" and time.monotonic() >= self.result_expires_at:
+                self.enter_idle()
+
             # ---- Keypad events ----
+            buf_dirty = False
             for ev, val in self.keypad.poll():
+                if self.state == "SHOW_RESULT":
+                    continue            # ignore input while a result is up
                 # Normal digit entry to start typing code
                 if ev == "key":
                     if self.state == "IDLE":
                         self.exit_idle()
                         self.state = "ENTERING"
-                        self.buf = ""
+                        self.buf = bytearray()
             
                     # Only accept digits into the code buffer
-                    if self.state == "ENTERING" and val and str(val).isdigit() and len(self.buf) < 5:
-                        self.buf += str(val)
-                        self.last_ts = time.time()
-                        self.show_buf()
+                    if self.state == "ENTERING" and val in _DIGITS and len(self.buf) < 5:
+                        self.buf += str(val).encode()
+                        self.last_ts = time.monotonic()
+                        buf_dirty = True
             
                 elif ev == "back":
                     if self.state == "ENTERING" and self.buf:
-                        self.buf = self.buf[:-1]
-                        self.last_ts = time.time()
-                        self.show_buf()
+                        del self.buf[-1:]
+                        self.last_ts = time.monotonic()
+                        buf_dirty = True
                     elif self.state == "ENTERING" and not self.buf:
                         self.enter_idle()
             
@@ -523,27 +688,49 @@ class App:
                         if len(self.buf) != 5:
                             self.exit_idle()
                             self.oled.show_lines(["INVALID", "Need 5 digits", "", ""])
-                            time.sleep(1.0)
-                            self.enter_idle()
+                            self._show_result(1.0)
                         else:
                             self.handle_code_submit()
+                            buf_dirty = False
+
+            # One redraw per batch: a burst of keys collapses into a
+            # single code-entry screen update.
+            if buf_dirty and self.state == "ENTERING":
+                self.show_buf()
 
             # ---- typing timeout ----
-            if self.state == "ENTERING" and (time.time() - self.last_ts) > 10:
+            if self.state == "ENTERING" and (time.monotonic() - self.last_ts) > 10:
                 self.enter_idle()
 
             # ---- Finger events ----
-            try:
-                while True:
-                    fev, fid = self.fq.get_nowait()
-                    if fev == "finger_ok":
-                        self.state = "IDLE"
-                        self.buf = ""
-                        self.handle_finger(int(fid))
-            except queue.Empty:
-                pass
-
-            time.sleep(0.02)
+            # The maxlen=1 deque keeps only the newest event; duplicates
+            # piled up during a result screen collapse into one dispatch.
+            if self.fq_event.is_set():
+                self.fq_event.clear()
+                try:
+                    fev, fid = self.fq.popleft()
+                except IndexError:      # cleared by a cooldown drain
+                    fev, fid = None, None
+                if fev == "finger_ok" and self.state != "SHOW_RESULT":
+                    self.state = "IDLE"
+                    self.buf = bytearray()
+                    self.handle_finger(int(fid))
+
+            # Sleep in select until keypad bytes, a finger wake byte, or
+            # the next deadline (idle frame / result expiry / typing
+            # timeout) instead of waking 50 times a second.
+            if self.state == "IDLE":
+                timeout = 1.0 / IDLE_FPS if IDLE_FPS > 0 else 0.5
+            elif self.state == "SHOW_RESULT":
+                timeout = max(0.0, self.result_expires_at - time.monotonic())
+            else:
+                timeout = max(0.0, 10 - (time.monotonic() - self.last_ts))
+            for key, _ in self._sel.select(timeout):
+                if key.data == "finger":
+                    try:
+                        os.read(self._finger_r, 64)     # drain wake bytes
+                    except BlockingIOError:
+                        pass
 
 
 def main():
@@ -6,10 +6,48 @@ from luma.core.interface.serial import i2c
 from luma.oled.device import ssd1306,ssd1309  # change if you use sh1106 etc.
 from PIL import Image, ImageDraw, ImageFont
 
-import time             
-import csv
+try:
+    from smbus2 import SMBus, i2c_msg   # single-burst framebuffer writes
+except ImportError:                     # raw path is optional; luma still works
+    SMBus = None
+
+try:
+    import numpy as np                  # fast frame packing at load time
+except ImportError:
+    np = None
+
+import time
+import threading
 from datetime import datetime
-from pathlib import Path
+
+I2C_ADDR = 0x3C
+
+
+def pack_frame(img: Image.Image) -> bytes:
+    """
+    Pack a mode-"1" PIL image into SSD1306 page order (one byte = 8 vertical
+    pixels, LSB at the top). Done once per frame at load time so blit_raw
+    can push the buffer without any per-frame repacking.
+    """
+    w, h = img.size
+    if np is not None:
+        # Vectorized: group rows into 8-row pages, pack each page column
+        # into one byte with the top row in bit 0.
+        arr = np.asarray(img, dtype=np.uint8).reshape(h // 8, 8, w)
+        return np.packbits(arr, axis=1, bitorder="little").tobytes()
+    px = img.load()
+    buf = bytearray((h // 8) * w)
+    i = 0
+    for page in range(h // 8):
+        base = page * 8
+        for x in range(w):
+            b = 0
+            for bit in range(8):
+                if px[x, base + bit]:
+                    b |= 1 << bit
+            buf[i] = b
+            i += 1
+    return bytes(buf)
 
 
 # =========================
@@ -20,17 +58,212 @@ class OLED:
         serial_iface = i2c(port=1, address=0x3C)  # most OLEDs use 0x3C
         self.device = ssd1306(serial_iface)       # This is the physical LED screen
         self.font = ImageFont.load_default()
+        self._last_lines = None                   # last frame pushed, to skip identical redraws
+        # One persistent frame buffer, cleared in place each redraw instead of
+        # allocating a fresh Image + Draw per frame.
+        self._img = Image.new("1", self.device.size, 0)
+        self._draw = ImageDraw.Draw(self._img)
+        self._frames = {}                         # prerendered static screens, by key
+        self._status_tpls = {}                    # clock-in/out backgrounds, by action
+        self._prev_buf = None                     # last packed frame, for partial updates
 
-    def show_lines(self, lines):                    # This is the text display Method.
-        img =  Image.new("1", self.device.size, 0)  # 1 = white background in 1-bit mode / Zero would produce a black background.
-        draw = ImageDraw.Draw(img)
+        # Optional background renderer: a single "latest wins" slot, so a
+        # new show_lines supersedes a pending frame instead of queueing
+        # behind it and the caller never waits on the I2C transfer.
+        self._cond = threading.Condition()
+        self._slot = None
+        self._render_lock = threading.Lock()      # serializes pushes to the panel
+        self._renderer = None
+
+        # Optional raw I2C path: one burst per frame instead of the
+        # driver's 16-byte chunks (2-3x faster refresh on SSD1306 panels).
+        self._bus = None
+        if SMBus is not None:
+            try:
+                self._bus = SMBus(1)
+                # Horizontal addressing + full column/page window once at
+                # init, so frames need no per-chunk addressing commands.
+                for c in (0x20, 0x00, 0x21, 0x00, 0x7F, 0x22, 0x00, 0x07):
+                    self._bus.write_byte_data(I2C_ADDR, 0x00, c)
+            except OSError:
+                self._bus = None
 
+    @property
+    def raw_ok(self) -> bool:
+        return self._bus is not None
+
+    def _set_window(self, col_start, col_end, page_start, page_end):
+        for c in (0x21, col_start, col_end, 0x22, page_start, page_end):
+            self._bus.write_byte_data(I2C_ADDR, 0x00, c)
+
+    def blit_raw(self, buf: bytes) -> None:
+        """Push a pack_frame() buffer as a single 0x40 + data I2C burst."""
+        with self._render_lock:     # don't interleave with the renderer thread
+            self._set_window(0x00, 0x7F, 0x00, 0x07)
+            self._bus.i2c_rdwr(i2c_msg.write(I2C_ADDR, b"\x40" + buf))
+            self._last_lines = None     # raw frames bypass the show_lines cache
+            self._prev_buf = bytes(buf)
+
+    def blit_slices(self, slices) -> None:
+        """
+        Write only changed regions: each slice is (page, col_start, data).
+        The window is narrowed per slice, so bytes sent scale with the
+        frame-to-frame delta instead of the full 1KB framebuffer.
+        """
+        with self._render_lock:     # don't interleave with the renderer thread
+            for page, col, data in slices:
+                self._set_window(col, col + len(data) - 1, page, page)
+                self._bus.i2c_rdwr(i2c_msg.write(I2C_ADDR, b"\x40" + data))
+            self._last_lines = None
+            self._prev_buf = None
+
+    def prerender(self, key, lines):
+        """Lay out a static screen once; blit(key) then skips PIL text drawing."""
+        img = Image.new("1", self.device.size, 0)
+        draw = ImageDraw.Draw(img)
         y = 0
-        for line in lines[:4]:                               # Creates a 12px font for each line of wording.
-            draw.text((0, y), line, font=self.font, fill=1)  # 0 = black text
+        for line in lines[:4]:
+            draw.text((0, y), line, font=self.font, fill=1)
             y += 12
+        self._frames[key] = img
+
+    def blit(self, key):
+        """Push a frame prepared with prerender(); no per-call text layout."""
+        marker = ("__frame__", key)
+        with self._render_lock:
+            if marker == self._last_lines:
+                return
+            self.device.display(self._frames[key])
+            self._last_lines = marker
+            self._prev_buf = None
+
+    # Static parts of the clock-in/out screens; only name/code/time are
+    # drawn per call in show_status().
+    _STATUS_TPL = {
+        "IN": ("WELCOME ", "Status: CLOCKED IN"),
+        "OUT": ("GOODBYE ", "Status: CLOCKED OUT"),
+    }
+
+    def _status_template(self, action):
+        tpl = self._status_tpls.get(action)
+        if tpl is None:
+            banner, status = self._STATUS_TPL[action]
+            img = Image.new("1", self.device.size, 0)
+            draw = ImageDraw.Draw(img)
+            draw.text((0, 0), banner, font=self.font, fill=1)
+            draw.text((0, 12), "Code: ", font=self.font, fill=1)
+            draw.text((0, 24), "Time: ", font=self.font, fill=1)
+            draw.text((0, 36), status, font=self.font, fill=1)
+            offsets = (draw.textlength(banner, font=self.font),
+                       draw.textlength("Code: ", font=self.font),
+                       draw.textlength("Time: ", font=self.font))
+            tpl = (img, offsets)
+            self._status_tpls[action] = tpl
+        return tpl
+
+    def show_status(self, action, name, code, t_now):
+        """Push the CLOCKED IN/OUT screen from a pre-drawn template.
+
+        The banner and field labels come from a cached background image;
+        each call rasterizes only the name, code and time strings.
+        Renders synchronously, superseding any pending async frame.
+        """
+        base, (x_name, x_code, x_time) = self._status_template(action)
+        img = base.copy()
+        draw = ImageDraw.Draw(img)
+        draw.text((x_name, 0), f"{name}!", font=self.font, fill=1)
+        draw.text((x_code, 12), str(code), font=self.font, fill=1)
+        draw.text((x_time, 24), t_now, font=self.font, fill=1)
+        with self._cond:
+            self._slot = None
+        with self._render_lock:
+            self.device.display(img)
+            self._last_lines = None
+            self._prev_buf = None
+
+    def _push_image(self, img):
+        """Send a text frame, transmitting only the changed columns of
+        each dirty page when the raw I2C path is up and the previous
+        frame is known; falls back to a full luma flush otherwise."""
+        if self._bus is None:
+            self.device.display(img)
+            return
+        buf = pack_frame(img)
+        prev = self._prev_buf
+        if prev is None:
+            self._set_window(0x00, 0x7F, 0x00, 0x07)
+            self._bus.i2c_rdwr(i2c_msg.write(I2C_ADDR, b"\x40" + buf))
+        else:
+            for page in range(8):
+                base = page * 128
+                p = prev[base:base + 128]
+                n = buf[base:base + 128]
+                if p == n:
+                    continue
+                start = 0
+                while n[start] == p[start]:
+                    start += 1
+                end = 127
+                while n[end] == p[end]:
+                    end -= 1
+                self._set_window(start, end, page, page)
+                self._bus.i2c_rdwr(i2c_msg.write(I2C_ADDR, b"\x40" + n[start:end + 1]))
+        self._prev_buf = buf
+
+    def start_renderer(self):
+        """Render show_lines frames on a daemon thread instead of inline."""
+        if self._renderer is None:
+            self._renderer = threading.Thread(target=self._render_loop, daemon=True)
+            self._renderer.start()
+
+    def _render_loop(self):
+        while True:
+            with self._cond:
+                while self._slot is None:
+                    self._cond.wait()
+                lines, self._slot = self._slot, None
+            try:
+                self._render_lines(lines)
+            except OSError:
+                # Transient I2C glitch: drop this frame but keep the
+                # renderer alive. Panel state is now unknown, so force
+                # the next frame to be drawn and sent in full.
+                with self._render_lock:
+                    self._last_lines = None
+                    self._prev_buf = None
+
+    def show_lines(self, lines):                    # This is the text display Method.
+        lines = tuple(lines[:4])
+        if self._renderer is None:                  # no thread started: render inline
+            self._render_lines(lines)
+            return
+        with self._cond:
+            self._slot = lines
+            self._cond.notify()
+
+    def show_lines_sync(self, lines):
+        """Push a frame before returning, superseding any pending async one.
+
+        Use this when the caller sleeps right after (e.g. the "Hi NAME"
+        screen) and the frame must be on the panel before the sleep starts.
+        """
+        with self._cond:
+            self._slot = None
+        self._render_lines(tuple(lines[:4]))
+
+    def _render_lines(self, lines):
+        with self._render_lock:
+            if lines == self._last_lines:           # identical frame -> skip the ~1KB I2C transfer
+                return
+            self._draw.rectangle((0, 0) + self.device.size, fill=0)
+
+            y = 0
+            for line in lines:                                         # Creates a 12px font for each line of wording.
+                self._draw.text((0, y), line, font=self.font, fill=1)  # 0 = black text
+                y += 12
 
-        self.device.display(img)
+            self._push_image(self._img)
+            self._last_lines = lines
 
     def show_arrival_message(oled, user_name_or_id):
         """